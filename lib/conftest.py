@@ -0,0 +1,53 @@
+"""Pytest configuration for lib tests."""
+import os
+import subprocess
+import time
+
+import pytest
+
+
+def _git(repo, *args, env=None):
+    result = subprocess.run(
+        ["git", *args], cwd=repo, check=True, capture_output=True, text=True, env=env
+    )
+    return result.stdout
+
+
+def _commit(repo, path, content, days_ago=0, message=None):
+    file_path = repo / path
+    file_path.parent.mkdir(parents=True, exist_ok=True)
+    file_path.write_text(content)
+    stamp = f"{int(time.time()) - days_ago * 86400} +0000"
+    env = {**os.environ, "GIT_AUTHOR_DATE": stamp, "GIT_COMMITTER_DATE": stamp}
+    _git(repo, "add", path)
+    _git(repo, "commit", "-q", "-m", message or f"update {path}", env=env)
+
+
+@pytest.fixture
+def git():
+    """Run a git command in a repository and return its output"""
+    return _git
+
+
+@pytest.fixture
+def commit():
+    """Write a file and commit it, dated days_ago days back"""
+    return _commit
+
+
+@pytest.fixture
+def git_repo(tmp_path, monkeypatch):
+    """An empty git repository with a fixed author and committer"""
+    for var in ("AUTHOR", "COMMITTER"):
+        monkeypatch.setenv(f"GIT_{var}_NAME", "Test")
+        monkeypatch.setenv(f"GIT_{var}_EMAIL", "test@example.com")
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    _git(repo, "init", "-q", "-b", "main")
+    return repo
+
+
+@pytest.fixture
+def worktree_status(git):
+    """Everything git status reports, ignored files included"""
+    return lambda repo: git(repo, "status", "--porcelain", "--ignored", "-uall")
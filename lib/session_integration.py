@@ -8,27 +8,41 @@ Functions to integrate session-management with context-manager and tdd-workflow.
 import sys
 import re
 import subprocess
+import time
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 
-# Add lib to path for imports
+# Add lib to path for imports (the sibling modules are imported lazily)
 sys.path.insert(0, str(Path(__file__).parent))
 
-from ccmp_integration import CCMPIntegration, get_context_health
-from context_loader import ContextLoader
-from test_pattern_analyzer import TestPatternAnalyzer
-
 
 class SessionIntegration:
     """Integration helpers for session-management."""
 
     def __init__(self, repo_path: Optional[str] = None):
         """Initialize session integration."""
+        from ccmp_integration import CCMPIntegration
+        from context_loader import ContextLoader
+        from test_pattern_analyzer import TestPatternAnalyzer
+
         self.integration = CCMPIntegration(repo_path)
         self.context_loader = ContextLoader(repo_path)
         self.pattern_analyzer = TestPatternAnalyzer()
         self.repo_path = Path(repo_path) if repo_path else Path.cwd()
+        self._health_cache: Optional[Tuple[float, Optional[Dict]]] = None
+
+    def _cached_health(self, ttl: float = 30.0) -> Optional[Dict]:
+        """Return context health, reusing a result computed within `ttl` seconds"""
+        now = time.monotonic()
+        if self._health_cache is not None and now - self._health_cache[0] < ttl:
+            return self._health_cache[1]
+
+        from ccmp_integration import get_context_health
+
+        health = get_context_health()
+        self._health_cache = (now, health)
+        return health
 
     def start_session(self, branch: str, objectives: List[str], mode: str = "normal"):
         """
@@ -51,49 +65,40 @@ class SessionIntegration:
             "objectives": objectives
         })
 
-        # Generate comprehensive brief
-        brief_parts = [
-            "🚀 SESSION STARTED",
-            "=" * 60,
-            f"Branch: {branch}",
-            f"Mode: {mode.upper()}",
-            "",
-            "📋 OBJECTIVES:",
-        ]
-
-        for i, obj in enumerate(objectives, 1):
-            brief_parts.append(f"  {i}. {obj}")
-
-        brief_parts.append("")
+        objectives_block = "".join(f"  {i}. {obj}\n" for i, obj in enumerate(objectives, 1))
 
         # Load relevant context
         context_brief = self.context_loader.generate_context_brief(objectives)
-        brief_parts.append(context_brief)
 
         # Check context health
-        health = get_context_health()
+        health_block = ""
+        health = self._cached_health()
         if health and health.get("health_score") is not None:
-            score = health["health_score"]
-            brief_parts.append("🏥 CONTEXT HEALTH")
-            brief_parts.append(f"   Overall: {score}/100")
+            health_block = f"🏥 CONTEXT HEALTH\n   Overall: {health['health_score']}/100\n"
 
             if health.get("critical_files"):
-                brief_parts.append(f"   ⚠️  {len(health['critical_files'])} files need attention")
+                health_block += f"   ⚠️  {len(health['critical_files'])} files need attention\n"
 
         # TDD mode notice
+        tdd_block = ""
         if mode == "tdd":
-            brief_parts.append("")
-            brief_parts.append("🧪 TDD MODE ACTIVE")
-            brief_parts.append("   • RED-GREEN-REFACTOR cycle enforcement")
-            brief_parts.append("   • Automatic phase checkpoints")
-            brief_parts.append("   • Test metrics tracking")
-
-        brief_parts.append("")
-        brief_parts.append("=" * 60)
-        brief_parts.append("Ready to code! 💻")
-        brief_parts.append("")
+            tdd_block = (
+                "\n🧪 TDD MODE ACTIVE\n"
+                "   • RED-GREEN-REFACTOR cycle enforcement\n"
+                "   • Automatic phase checkpoints\n"
+                "   • Test metrics tracking\n"
+            )
 
-        return "\n".join(brief_parts)
+        rule = "=" * 60
+        return (
+            f"🚀 SESSION STARTED\n{rule}\n"
+            f"Branch: {branch}\n"
+            f"Mode: {mode.upper()}\n\n"
+            f"📋 OBJECTIVES:\n{objectives_block}\n"
+            f"{context_brief}\n"
+            f"{health_block}{tdd_block}\n"
+            f"{rule}\nReady to code! 💻\n"
+        )
 
     def checkpoint(self, label: str, changed_directories: Optional[List[Path]] = None) -> str:
         """
@@ -106,27 +111,31 @@ class SessionIntegration:
         Returns:
             Status message
         """
-        messages = [f"✅ Checkpoint created: {label}"]
+        # Context may have changed since the last health read
+        self._health_cache = None
+
+        stale_block = ""
+        missing_block = ""
 
         # Check context health for changed directories
         if changed_directories:
             health_report = self.context_loader.check_context_health(changed_directories)
 
             if health_report["stale"]:
-                messages.append("")
-                messages.append("⚠️  CONTEXT HEALTH WARNING:")
-                for item in health_report["stale"]:
-                    messages.append(f"   • {item['path']} (stale: {item['age_days']} days)")
-                messages.append("")
-                messages.append("💡 Update context? Run: python scripts/auto_update.py <directory>")
+                stale_items = "".join(
+                    f"\n   • {item['path']} (stale: {item['age_days']} days)"
+                    for item in health_report["stale"]
+                )
+                stale_block = (
+                    f"\n\n⚠️  CONTEXT HEALTH WARNING:{stale_items}"
+                    "\n\n💡 Update context? Run: python scripts/auto_update.py <directory>"
+                )
 
             if health_report["missing"]:
-                messages.append("")
-                messages.append("ℹ️  Missing context files:")
-                for path in health_report["missing"]:
-                    messages.append(f"   • {path}/")
+                missing_items = "".join(f"\n   • {path}/" for path in health_report["missing"])
+                missing_block = f"\n\nℹ️  Missing context files:{missing_items}"
 
-        return "\n".join(messages)
+        return f"✅ Checkpoint created: {label}{stale_block}{missing_block}"
 
     def end_session(self, generate_handoff: bool = True) -> str:
         """
@@ -150,35 +159,29 @@ class SessionIntegration:
         if not generate_handoff:
             return "Session ended."
 
-        # Generate handoff
-        handoff_parts = [
-            "📝 SESSION HANDOFF",
-            "=" * 60,
-            f"Branch: {session_state.get('branch', 'unknown')}",
-            f"Mode: {session_state.get('mode', 'normal').upper()}",
-            ""
-        ]
-
         # Check context health for handoff
-        health = get_context_health()
+        health_block = ""
+        health = self._cached_health()
         if health:
             score = health.get("health_score", "unknown")
-            handoff_parts.append("🏥 CONTEXT HEALTH")
-            handoff_parts.append(f"   Final score: {score}/100")
+            health_block = f"🏥 CONTEXT HEALTH\n   Final score: {score}/100\n"
 
             if health.get("critical_files"):
-                handoff_parts.append("   ⚠️  Attention needed:")
-                for file in health["critical_files"][:5]:
-                    handoff_parts.append(f"      • {file}")
+                health_block += "   ⚠️  Attention needed:\n" + "".join(
+                    f"      • {file}\n" for file in health["critical_files"][:5]
+                )
 
-            handoff_parts.append("")
+            health_block += "\n"
 
         # TDD metrics (if TDD session)
+        tdd_block = ""
         if session_state.get("mode") == "tdd":
             tdd_state = self.integration.get_state("tdd-workflow")
-            handoff_parts.append("🧪 TDD METRICS")
-            handoff_parts.append(f"   Cycles completed: {tdd_state.get('cycles_today', 0)}")
-            handoff_parts.append(f"   Discipline score: {tdd_state.get('discipline_score', 100)}/100")
+            tdd_block = (
+                "🧪 TDD METRICS\n"
+                f"   Cycles completed: {tdd_state.get('cycles_today', 0)}\n"
+                f"   Discipline score: {tdd_state.get('discipline_score', 100)}/100\n"
+            )
 
             # Add TDD analysis
             try:
@@ -187,21 +190,26 @@ class SessionIntegration:
                 commit_analysis = analyzer.analyze_session_commits()
 
                 if commit_analysis["violations"]:
-                    handoff_parts.append(f"   ⚠️  Violations detected: {sum(commit_analysis['violations'].values())}")
+                    tdd_block += f"   ⚠️  Violations detected: {sum(commit_analysis['violations'].values())}\n"
 
-                handoff_parts.append(f"   Commits with tests: {commit_analysis['commits_with_tests']}")
-                handoff_parts.append(f"   Commits without tests: {commit_analysis['commits_without_tests']}")
+                tdd_block += (
+                    f"   Commits with tests: {commit_analysis['commits_with_tests']}\n"
+                    f"   Commits without tests: {commit_analysis['commits_without_tests']}\n"
+                )
             except Exception:
                 # If analysis fails, just skip it
                 pass
 
-            handoff_parts.append("")
-
-        handoff_parts.append("=" * 60)
-        handoff_parts.append("Session complete. Context preserved for next session.")
-        handoff_parts.append("")
+            tdd_block += "\n"
 
-        return "\n".join(handoff_parts)
+        rule = "=" * 60
+        return (
+            f"📝 SESSION HANDOFF\n{rule}\n"
+            f"Branch: {session_state.get('branch', 'unknown')}\n"
+            f"Mode: {session_state.get('mode', 'normal').upper()}\n\n"
+            f"{health_block}{tdd_block}"
+            f"{rule}\nSession complete. Context preserved for next session.\n"
+        )
 
     def get_changed_test_files(self) -> List[Path]:
         """Get test files that have changed since last commit"""
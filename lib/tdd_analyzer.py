@@ -11,105 +11,128 @@ Usage:
     violations = analyzer.analyze_session("feature/auth")
 """
 
+import json
+import math
+import os
 import subprocess
 import re
+import time
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime, timedelta
-from collections import defaultdict
+from collections import Counter
+
+# Source file extensions, stored without the leading dot
+_SRC_EXT_SUFFIXES = frozenset({'py', 'js', 'ts', 'jsx', 'tsx', 'java', 'go', 'rb'})
+
+# Directory inside the git dir holding cached analyses
+_CACHE_DIR = 'ccmp-cache'
 
 
 class TDDAnalyzer:
     """Analyzes sessions for TDD violations"""
 
+    # Path and message patterns; these are plain substring matches
+    _RE_TEST_INDICATOR = re.compile(r'test_|_test\.|\.test\.|\.spec\.|/tests?/')
+    _RE_TDD_WORDS = re.compile(r'test|tdd|spec|coverage')
+    _RE_ANTIPATTERN = re.compile(r'(?:fix|update|skip) test')
+
+    # (predicate, template) pairs evaluated against the analysis dict
+    _RECOMMENDATION_RULES = [
+        (lambda a: a["commits_without_tests"] > 0,
+         "{commits_without_tests} commits modified source without tests - ensure test-first development"),
+        (lambda a: a["violations"]["source_without_tests"] > 3,
+         "High frequency of source changes without tests - review TDD discipline"),
+        (lambda a: a["violations"]["test_fix_after_code"] > 0,
+         "Tests were fixed after implementation - tests should fail first"),
+    ]
+
+    # Cached analyses older than this are recomputed even if HEAD is unchanged
+    _CACHE_TTL_SECONDS = 3600
+
     def __init__(self, repo_path: str = "."):
         """Initialize analyzer"""
-        self.repo_path = Path(repo_path).resolve()
+        # Kept as given; git resolves it and subprocess takes a plain str cwd
+        self.repo_path = os.fspath(repo_path)
+        self._commits_cache: Dict[str, List[Dict]] = {}
 
     def get_commits_since(self, since: str = "1 week ago") -> List[Dict]:
-        """Get commits since a given time"""
-        try:
-            result = subprocess.run(
-                ["git", "log", f"--since={since}", "--pretty=format:%H|%an|%ae|%s|%ad", "--date=iso"],
-                capture_output=True,
-                text=True,
-                cwd=self.repo_path,
-                check=True
-            )
+        """Get commits since a given time, with their changed files attached"""
+        if since in self._commits_cache:
+            return self._commits_cache[since]
 
+        try:
             commits = []
-            for line in result.stdout.strip().split('\n'):
-                if not line:
-                    continue
-
-                parts = line.split('|')
-                if len(parts) >= 5:
-                    commits.append({
-                        "hash": parts[0],
-                        "author": parts[1],
-                        "email": parts[2],
-                        "message": parts[3],
-                        "date": parts[4]
-                    })
-
+            commit = None
+
+            # One git log call for metadata and file lists; each record starts
+            # with an ASCII record separator so headers can't be confused
+            # with name-status lines.
+            with subprocess.Popen(
+                ["git", "log", f"--since={since}", "--no-merges", "--name-status",
+                 "--pretty=format:%x1e%H%x00%an%x00%ae%x00%s%x00%aI"],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+                cwd=self.repo_path
+            ) as proc:
+                # Parse as git writes rather than buffering the whole log
+                for line in proc.stdout:
+                    line = line.rstrip('\n')
+                    if line.startswith('\x1e'):
+                        # NUL never appears in git fields, so this split is exact
+                        commit_hash, author, email, message, date = line[1:].split('\x00')
+                        commit = {
+                            "hash": commit_hash,
+                            "author": author,
+                            "email": email,
+                            "message": message,
+                            "message_lc": message.lower(),
+                            "date": date,
+                            "datetime": datetime.fromisoformat(date),
+                            "files": {"test": [], "source": []}
+                        }
+                        commits.append(commit)
+                        continue
+
+                    if not line or commit is None:
+                        continue
+
+                    parts = line.split('\t')
+                    if len(parts) >= 2:
+                        self._classify_file(parts[1], commit["files"])
+
+            if proc.returncode != 0:
+                return []
+
+            self._commits_cache[since] = commits
             return commits
         except Exception:
             return []
 
-    def get_commit_files(self, commit_hash: str) -> Dict[str, List[str]]:
-        """Get files changed in a commit"""
-        try:
-            result = subprocess.run(
-                ["git", "show", "--name-status", "--pretty=format:", commit_hash],
-                capture_output=True,
-                text=True,
-                cwd=self.repo_path,
-                check=True
-            )
-
-            files = {
-                "test": [],
-                "source": [],
-                "other": []
-            }
-
-            test_indicators = ['test_', '_test.', '.test.', '.spec.', '/tests/', '/test/']
-
-            for line in result.stdout.strip().split('\n'):
-                if not line:
-                    continue
-
-                parts = line.split('\t')
-                if len(parts) >= 2:
-                    file_path = parts[1]
-
-                    if any(indicator in file_path for indicator in test_indicators):
-                        files["test"].append(file_path)
-                    elif file_path.endswith(('.py', '.js', '.ts', '.jsx', '.tsx', '.java', '.go', '.rb')):
-                        files["source"].append(file_path)
-                    else:
-                        files["other"].append(file_path)
-
-            return files
-        except Exception:
-            return {"test": [], "source": [], "other": []}
+    def _classify_file(self, file_path: str, files: Dict[str, List[str]]):
+        """Sort a changed path into the test/source buckets"""
+        if self._RE_TEST_INDICATOR.search(file_path):
+            files["test"].append(file_path)
+        elif file_path.rpartition('.')[2] in _SRC_EXT_SUFFIXES:
+            files["source"].append(file_path)
 
     def detect_commit_violations(self, commit: Dict) -> List[str]:
         """Detect TDD violations in a commit"""
         violations = []
 
-        # Get files changed
-        files = self.get_commit_files(commit["hash"])
+        # Files changed, as parsed by get_commits_since
+        files = commit["files"]
 
         # Violation 1: Source code changes without test changes
         if files["source"] and not files["test"]:
             violations.append("source_without_tests")
 
         # Violation 2: Check commit message for TDD indicators
-        message = commit["message"].lower()
+        message = commit["message_lc"]
 
         # Good signs
-        if any(word in message for word in ["test", "tdd", "spec", "coverage"]):
+        if self._RE_TDD_WORDS.search(message):
             # Likely test-focused commit
             pass
         elif files["source"] and not files["test"]:
@@ -117,12 +140,55 @@ class TDDAnalyzer:
             violations.append("no_test_mention")
 
         # Check for anti-patterns in message
-        if any(phrase in message for phrase in ["fix test", "fix tests", "update test", "skip test"]):
+        if self._RE_ANTIPATTERN.search(message):
             violations.append("test_fix_after_code")
 
         return violations
 
-    def analyze_session_commits(self, branch: str = None) -> Dict:
+    def _git_state(self) -> Optional[Tuple[str, Path]]:
+        """Get HEAD and the cache directory inside the git dir, or None outside a repository"""
+        try:
+            result = subprocess.run(
+                ["git", "rev-parse", "HEAD", "--git-path", _CACHE_DIR],
+                capture_output=True,
+                text=True,
+                cwd=self.repo_path,
+                check=True
+            )
+            head, cache_dir = result.stdout.splitlines()
+            return head, Path(self.repo_path, cache_dir)
+        except Exception:
+            return None
+
+    def _load_cached_analysis(self, cache_file: Path, head: str) -> Optional[Dict]:
+        """Return the cached analysis if it was made at this HEAD within the TTL"""
+        try:
+            if time.time() - cache_file.stat().st_mtime >= self._CACHE_TTL_SECONDS:
+                return None
+            with open(cache_file, 'r') as f:
+                cached = json.load(f)
+        except (OSError, ValueError):
+            return None
+        return cached["analysis"] if cached.get("head") == head else None
+
+    def _store_cached_analysis(self, cache_file: Path, head: str, analysis: Dict):
+        """Write the analysis to the cache and drop entries past the TTL"""
+        try:
+            cache_file.parent.mkdir(exist_ok=True)
+            tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+            with open(tmp_file, 'w') as f:
+                json.dump({"head": head, "analysis": analysis}, f)
+            os.replace(tmp_file, cache_file)
+
+            cutoff = time.time() - self._CACHE_TTL_SECONDS
+            with os.scandir(cache_file.parent) as entries:
+                for entry in entries:
+                    if entry.name.startswith("tdd_") and entry.stat().st_mtime < cutoff:
+                        os.unlink(entry.path)
+        except OSError:
+            pass
+
+    def analyze_session_commits(self, branch: str = None, since: str = "1 week ago") -> Dict:
         """Analyze commits in current session/branch"""
         if not branch:
             # Get current branch
@@ -138,12 +204,25 @@ class TDDAnalyzer:
             except Exception:
                 branch = "main"
 
+        # Reuse a recent analysis while HEAD hasn't moved. The cache lives in
+        # the git dir, one file per time window, so it never touches the
+        # worktree and doesn't grow as HEAD moves.
+        git_state = self._git_state()
+        cache_file = None
+        if git_state is not None:
+            head, cache_dir = git_state
+            since_key = re.sub(r'\W+', '-', since).strip('-')
+            cache_file = cache_dir / f"tdd_{since_key}.json"
+            cached = self._load_cached_analysis(cache_file, head)
+            if cached is not None:
+                return cached
+
         # Get commits
-        commits = self.get_commits_since("1 week ago")
+        commits = self.get_commits_since(since)
 
         analysis = {
             "total_commits": len(commits),
-            "violations": defaultdict(int),
+            "violations": Counter(),
             "clean_commits": 0,
             "commits_with_tests": 0,
             "commits_without_tests": 0,
@@ -152,20 +231,18 @@ class TDDAnalyzer:
         }
 
         for commit in commits:
+            files = commit["files"]
             violations = self.detect_commit_violations(commit)
 
             if not violations:
                 analysis["clean_commits"] += 1
 
-            files = self.get_commit_files(commit["hash"])
-
             if files["test"]:
                 analysis["commits_with_tests"] += 1
             elif files["source"]:
                 analysis["commits_without_tests"] += 1
 
-            for violation in violations:
-                analysis["violations"][violation] += 1
+            analysis["violations"].update(violations)
 
         # Calculate TDD score
         if analysis["total_commits"] > 0:
@@ -173,24 +250,18 @@ class TDDAnalyzer:
             analysis["tdd_score"] = max(0, 100 - violation_penalty)
 
         # Generate recommendations
-        if analysis["commits_without_tests"] > 0:
-            analysis["recommendations"].append(
-                f"{analysis['commits_without_tests']} commits modified source without tests - ensure test-first development"
-            )
-
-        if analysis["violations"]["source_without_tests"] > 3:
-            analysis["recommendations"].append(
-                "High frequency of source changes without tests - review TDD discipline"
-            )
-
-        if analysis["violations"]["test_fix_after_code"] > 0:
-            analysis["recommendations"].append(
-                "Tests were fixed after implementation - tests should fail first"
-            )
+        analysis["recommendations"] = [
+            template.format(**analysis)
+            for applies, template in self._RECOMMENDATION_RULES
+            if applies(analysis)
+        ]
 
-        # Convert defaultdict to dict
+        # Convert Counter to dict
         analysis["violations"] = dict(analysis["violations"])
 
+        if cache_file is not None:
+            self._store_cached_analysis(cache_file, head, analysis)
+
         return analysis
 
     def analyze_tdd_cycle_timing(self) -> Dict:
@@ -198,30 +269,26 @@ class TDDAnalyzer:
         commits = self.get_commits_since("1 week ago")
 
         cycles = []
-        current_cycle = {"red": None, "green": None}
+        red_commit = None
 
         for commit in commits:
-            message = commit["message"].lower()
-            files = self.get_commit_files(commit["hash"])
+            message = commit["message_lc"]
+            files = commit["files"]
 
             # Detect RED (test-only commit)
             if files["test"] and not files["source"]:
                 if "red" in message or "fail" in message or "test" in message:
-                    current_cycle["red"] = commit
-                    current_cycle["red_time"] = datetime.fromisoformat(commit["date"].replace(' ', 'T').split('+')[0])
-
-            # Detect GREEN (implementation commit)
-            elif files["source"]:
-                if current_cycle["red"]:
-                    current_cycle["green"] = commit
-                    current_cycle["green_time"] = datetime.fromisoformat(commit["date"].replace(' ', 'T').split('+')[0])
-
-                    # Calculate cycle time
-                    time_diff = current_cycle["green_time"] - current_cycle["red_time"]
-                    current_cycle["duration_minutes"] = time_diff.total_seconds() / 60
-
-                    cycles.append(current_cycle.copy())
-                    current_cycle = {"red": None, "green": None}
+                    red_commit = commit
+
+            # Detect GREEN (implementation commit) closing an open cycle
+            elif files["source"] and red_commit:
+                duration = commit["datetime"] - red_commit["datetime"]
+                cycles.append({
+                    "red": red_commit,
+                    "green": commit,
+                    "duration_minutes": duration.total_seconds() / 60
+                })
+                red_commit = None
 
         analysis = {
             "total_cycles": len(cycles),
@@ -231,10 +298,20 @@ class TDDAnalyzer:
         }
 
         if cycles:
-            durations = [c["duration_minutes"] for c in cycles]
-            analysis["average_cycle_time"] = sum(durations) / len(durations)
-            analysis["fastest_cycle"] = min(durations)
-            analysis["slowest_cycle"] = max(durations)
+            total = 0.0
+            fastest = math.inf
+            slowest = -math.inf
+            for cycle in cycles:
+                duration = cycle["duration_minutes"]
+                total += duration
+                if duration < fastest:
+                    fastest = duration
+                if duration > slowest:
+                    slowest = duration
+
+            analysis["average_cycle_time"] = total / len(cycles)
+            analysis["fastest_cycle"] = fastest
+            analysis["slowest_cycle"] = slowest
 
         return analysis
 
@@ -0,0 +1,52 @@
+import os
+import time
+
+import pytest
+from tdd_analyzer import TDDAnalyzer
+
+
+@pytest.fixture
+def repo(git_repo, commit):
+    """A git repository with a test, a source and a docs-only commit"""
+    for path, message in (("tests/test_auth.py", "add failing test"),
+                          ("src/auth.py", "implement auth"),
+                          ("docs/auth.md", "fix test docs")):
+        commit(git_repo, path, message, message=message)
+    return git_repo
+
+
+def test_analysis_counts_every_commit(repo):
+    """Commits touching neither tests nor source still count"""
+    analysis = TDDAnalyzer(str(repo)).analyze_session_commits()
+    assert analysis["total_commits"] == 3
+    assert analysis["commits_with_tests"] == 1
+    assert analysis["commits_without_tests"] == 1
+    # The docs-only commit's message is still checked
+    assert analysis["violations"]["test_fix_after_code"] == 1
+
+
+def test_cache_follows_head_in_git_dir(repo, commit, worktree_status):
+    """One entry per window lives in the git dir, follows HEAD and prunes expired ones"""
+    cache_dir = repo / ".git" / "ccmp-cache"
+    cache_dir.mkdir()
+    stale = cache_dir / "tdd_2-weeks-ago.json"
+    stale.write_text("{}")
+    expired = time.time() - TDDAnalyzer._CACHE_TTL_SECONDS - 60
+    os.utime(stale, (expired, expired))
+
+    first = TDDAnalyzer(str(repo)).analyze_session_commits()
+    # Analyzing from a subdirectory reuses the same entry
+    assert TDDAnalyzer(str(repo / "src")).analyze_session_commits() == first
+    assert os.listdir(cache_dir) == ["tdd_1-week-ago.json"]
+
+    commit(repo, "src/session.py", "add session", message="add session")
+    assert TDDAnalyzer(str(repo)).analyze_session_commits()["total_commits"] == 4
+    assert os.listdir(cache_dir) == ["tdd_1-week-ago.json"]
+    assert worktree_status(repo) == ""
+
+
+def test_no_cache_outside_git(tmp_path):
+    """Outside a repository nothing is analyzed or written"""
+    analysis = TDDAnalyzer(str(tmp_path)).analyze_session_commits()
+    assert analysis["total_commits"] == 0
+    assert os.listdir(tmp_path) == []
@@ -12,12 +12,17 @@ Usage:
 import os
 import sys
 import argparse
+import hashlib
+import io
 from pathlib import Path
 from datetime import datetime
-from typing import List, Dict, Set
+from typing import List, Dict, Set, Tuple
+from concurrent.futures import ThreadPoolExecutor
 import subprocess
 import re
 
+import git_cache
+
 # Add lib to path for integration imports
 repo_root = Path(__file__).resolve().parents[6]  # Go up to repo root
 sys.path.insert(0, str(repo_root / "lib"))
@@ -28,40 +33,95 @@ try:
 except ImportError:
     INTEGRATION_AVAILABLE = False
 
+# Source files scanned for imports and frameworks
+SCANNED_EXTENSIONS = frozenset({'.py', '.js', '.ts', '.jsx', '.tsx'})
+
+# Below this many source files a thread pool costs more than it saves
+PARALLEL_SCAN_MIN_FILES = 8
+
+# Bytes read from each source file when scanning for imports and frameworks
+SCAN_READ_LIMIT = 64 * 1024
+
+# Import patterns, compiled once rather than per scanned file
+_PY_IMPORT_RE = re.compile(r'^\s*(?:from|import)\s+([a-zA-Z_][a-zA-Z0-9_]*)', re.MULTILINE)
+_JS_IMPORT_RE = re.compile(r'(?:from|require\()\s*[\'"]([^\'\"]+)')
+
+# Framework mentions per language, matched case-insensitively without
+# lower-casing a copy of each file
+_PY_FRAMEWORK_RE = re.compile(r'fastapi|flask', re.IGNORECASE | re.ASCII)
+_JS_FRAMEWORK_RE = re.compile(r'react|express|vue', re.IGNORECASE | re.ASCII)
+FRAMEWORK_NAMES = {
+    'fastapi': 'FastAPI',
+    'flask': 'Flask',
+    'react': 'React',
+    'express': 'Express',
+    'vue': 'Vue',
+}
+
+# A `git log --name-status -z` record: "STATUS\0path\0", or for renames and
+# copies "RSCORE\0old\0new\0" (matched without a status group)
+_NAME_STATUS_RE = re.compile(rb'[RC][0-9]*\0[^\0]*\0[^\0]*\0|([A-Z])[0-9]*\0([^\0]*)\0')
+
+# Cached summaries untouched for this long are deleted on the next write
+CHANGES_CACHE_MAX_AGE = 7 * 24 * 3600
+
 def get_recent_changes(dir_path: Path, since_days: int = 30) -> Dict:
-    """Get summary of recent changes in directory."""
+    """Get summary of recent changes in directory.
+    
+    The summary only depends on HEAD, the window and today's date, so it is
+    cached in the git dir under those and git history is walked only when
+    one of them changed.
+    """
+    state = git_cache.git_state(dir_path)
+    if state is None:
+        return _git_recent_changes(dir_path, since_days)
+    head, cache_dir = state
+    
+    # One entry per directory and window, replaced as HEAD or the day moves on
+    key = {'head': head, 'date': datetime.now().date().isoformat()}
+    name = hashlib.sha1(f'{dir_path}\0{since_days}'.encode()).hexdigest()[:12]
+    changes = git_cache.load(cache_dir, 'auto_update', name, key)
+    if changes is None:
+        changes = _git_recent_changes(dir_path, since_days)
+        git_cache.store(cache_dir, 'auto_update', name, key, changes, CHANGES_CACHE_MAX_AGE)
+    return changes
+
+def _git_recent_changes(dir_path: Path, since_days: int) -> Dict:
+    """Get summary of changes made by commits in the window from git log."""
     try:
-        # Get changed files
+        # Get files changed by commits in the window, NUL-delimited
         result = subprocess.run(
-            ['git', 'diff', '--name-status', f'HEAD~{since_days*4}', 'HEAD', '--', str(dir_path)],
+            ['git', 'log', '--name-status', '-z', '--since', f'{since_days} days ago',
+             '--pretty=format:', '--', str(dir_path)],
             cwd=dir_path,
-            capture_output=True,
-            text=True
+            capture_output=True
         )
         
         if result.returncode != 0:
             return {'files_changed': [], 'summary': {}}
         
-        changes = result.stdout.strip().split('\n')
+        # Sets, since a file touched by several commits is reported once each
+        added = set()
+        modified = set()
+        deleted = set()
         
-        added = []
-        modified = []
-        deleted = []
-        
-        for change in changes:
-            if not change:
-                continue
-            parts = change.split('\t', 1)
-            if len(parts) != 2:
+        # One regex pass over the raw bytes, no per-record splitting
+        for match in _NAME_STATUS_RE.finditer(result.stdout):
+            status = match.group(1)
+            if status is None:  # rename or copy
                 continue
-            status, filepath = parts
             
-            if status.startswith('A'):
-                added.append(filepath)
-            elif status.startswith('M'):
-                modified.append(filepath)
-            elif status.startswith('D'):
-                deleted.append(filepath)
+            filepath = match.group(2).decode('utf-8', 'surrogateescape')
+            if status == b'A':
+                added.add(filepath)
+            elif status == b'M':
+                modified.add(filepath)
+            elif status == b'D':
+                deleted.add(filepath)
+        
+        added = sorted(added)
+        modified = sorted(modified)
+        deleted = sorted(deleted)
         
         return {
             'files_changed': added + modified + deleted,
@@ -79,6 +139,36 @@ def get_recent_changes(dir_path: Path, since_days: int = 30) -> Dict:
     except:
         return {'files_changed': [], 'summary': {}}
 
+def _scan_source_file(file_path: Path, ext: str) -> Tuple[List[str], Set[str]]:
+    """Get the leading imports and detected frameworks of one source file."""
+    imports = []
+    frameworks = set()
+    try:
+        # Imports and framework mentions live in the file header; bundles and
+        # generated files are not worth reading in full
+        with open(file_path, 'rb') as f:
+            data = f.read(SCAN_READ_LIMIT)
+        if data.startswith(b'{'):  # JSON-looking, nothing to extract
+            return imports, frameworks
+        content = data.decode('utf-8', errors='ignore')
+        
+        # Python imports
+        if ext == '.py':
+            imports = _PY_IMPORT_RE.findall(content)
+            framework_re = _PY_FRAMEWORK_RE
+        
+        # JavaScript/TypeScript imports
+        else:
+            imports = _JS_IMPORT_RE.findall(content)
+            framework_re = _JS_FRAMEWORK_RE
+        
+        # Detect frameworks
+        frameworks = {FRAMEWORK_NAMES[name.lower()] for name in framework_re.findall(content)}
+    except OSError:
+        pass
+    
+    return imports[:5], frameworks  # Top 5 imports
+
 def analyze_code_patterns(dir_path: Path) -> Dict:
     """Analyze current code patterns in directory."""
     patterns = {
@@ -88,42 +178,32 @@ def analyze_code_patterns(dir_path: Path) -> Dict:
         'frameworks_detected': set()
     }
     
-    # Analyze files
-    for item in dir_path.iterdir():
-        if item.is_file() and not item.name.startswith('.'):
-            ext = item.suffix
-            patterns['file_types'][ext] = patterns['file_types'].get(ext, 0) + 1
-            
-            # Analyze imports for common patterns
-            if ext in ['.py', '.js', '.ts', '.jsx', '.tsx']:
-                try:
-                    content = item.read_text()
-                    
-                    # Python imports
-                    if ext == '.py':
-                        imports = re.findall(r'^\s*(?:from|import)\s+([a-zA-Z_][a-zA-Z0-9_]*)', content, re.MULTILINE)
-                        patterns['common_imports'].update(imports[:5])  # Top 5
-                        
-                        # Detect frameworks
-                        if 'fastapi' in content.lower():
-                            patterns['frameworks_detected'].add('FastAPI')
-                        if 'flask' in content.lower():
-                            patterns['frameworks_detected'].add('Flask')
-                    
-                    # JavaScript/TypeScript imports
-                    elif ext in ['.js', '.ts', '.jsx', '.tsx']:
-                        imports = re.findall(r'(?:from|require\()\s*[\'"]([^\'\"]+)', content)
-                        patterns['common_imports'].update(imports[:5])
-                        
-                        # Detect frameworks
-                        if 'react' in content.lower():
-                            patterns['frameworks_detected'].add('React')
-                        if 'express' in content.lower():
-                            patterns['frameworks_detected'].add('Express')
-                        if 'vue' in content.lower():
-                            patterns['frameworks_detected'].add('Vue')
-                except:
-                    pass
+    # Count files and collect the ones to scan for imports
+    source_files = []
+    source_exts = []
+    with os.scandir(dir_path) as entries:
+        for entry in entries:
+            # DirEntry answers is_file() from the directory listing, no extra stat
+            if entry.is_file() and not entry.name.startswith('.'):
+                # Same as Path.suffix: a trailing dot is not a suffix
+                ext = os.path.splitext(entry.name)[1].rstrip('.')
+                patterns['file_types'][ext] = patterns['file_types'].get(ext, 0) + 1
+                
+                if ext in SCANNED_EXTENSIONS:
+                    source_files.append(Path(entry.path))
+                    source_exts.append(ext)
+    
+    # Scanning is dominated by file reads, so overlap them on larger directories
+    if len(source_files) < PARALLEL_SCAN_MIN_FILES:
+        results = map(_scan_source_file, source_files, source_exts)
+    else:
+        with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as executor:
+            results = list(executor.map(_scan_source_file, source_files, source_exts))
+    
+    # Aggregate in this thread so the shared sets are never written concurrently
+    for imports, frameworks in results:
+        patterns['common_imports'].update(imports)
+        patterns['frameworks_detected'].update(frameworks)
     
     patterns['common_imports'] = list(patterns['common_imports'])
     patterns['frameworks_detected'] = list(patterns['frameworks_detected'])
@@ -133,7 +213,7 @@ def analyze_code_patterns(dir_path: Path) -> Dict:
 def read_existing_context(context_file: Path) -> str:
     """Read existing context file."""
     if context_file.exists():
-        return context_file.read_text()
+        return context_file.read_bytes().decode('utf-8', 'replace')
     return ""
 
 def needs_update(existing_context: str, current_patterns: Dict, recent_changes: Dict) -> Dict:
@@ -155,15 +235,21 @@ def needs_update(existing_context: str, current_patterns: Dict, recent_changes:
         update_needed['sections_to_update'].append('File Types')
         update_needed['sections_to_update'].append('Key Files')
     
-    # Check if frameworks mentioned in context match detected
-    for framework in current_patterns.get('frameworks_detected', []):
-        if framework not in existing_context:
+    # Check if frameworks mentioned in context match detected, finding every
+    # mention in one pass over the context
+    frameworks = current_patterns.get('frameworks_detected', [])
+    mentioned = set()
+    if frameworks:
+        mention_re = re.compile('|'.join(map(re.escape, frameworks)))
+        mentioned = set(mention_re.findall(existing_context))
+    for framework in frameworks:
+        if framework not in mentioned:
             update_needed['should_update'] = True
             update_needed['reasons'].append(f'New framework detected: {framework}')
             update_needed['sections_to_update'].append('Important Patterns')
     
     # Check if context has TODO markers
-    if 'TODO' in existing_context or '<!-- TODO' in existing_context:
+    if 'TODO' in existing_context:  # also covers '<!-- TODO'
         update_needed['should_update'] = True
         update_needed['reasons'].append('Context has TODO markers')
         update_needed['sections_to_update'].append('All incomplete sections')
@@ -212,38 +298,39 @@ def generate_updated_sections(existing_context: str, current_patterns: Dict, rec
 
 def format_update_report(dir_path: Path, update_analysis: Dict, suggestions: Dict, analyze_only: bool) -> str:
     """Format update report for Claude to read."""
-    lines = []
-    lines.append("=" * 70)
-    lines.append("CONTEXT UPDATE ANALYSIS")
-    lines.append("=" * 70)
-    lines.append(f"\nDirectory: {dir_path}")
-    lines.append(f"Timestamp: {datetime.now().isoformat()}")
-    lines.append(f"\nMode: {'ANALYZE ONLY' if analyze_only else 'UPDATE READY'}")
+    buf = io.StringIO()
+    buf.write("=" * 70 + "\n")
+    buf.write("CONTEXT UPDATE ANALYSIS\n")
+    buf.write("=" * 70 + "\n")
+    buf.write(f"\nDirectory: {dir_path}\n")
+    buf.write(f"Timestamp: {datetime.now().isoformat()}\n")
+    buf.write(f"\nMode: {'ANALYZE ONLY' if analyze_only else 'UPDATE READY'}\n")
     
     if update_analysis['should_update']:
-        lines.append("\n✅ UPDATE RECOMMENDED")
-        lines.append("\nReasons:")
+        buf.write("\n✅ UPDATE RECOMMENDED\n")
+        buf.write("\nReasons:\n")
         for reason in update_analysis['reasons']:
-            lines.append(f"  • {reason}")
+            buf.write(f"  • {reason}\n")
         
-        lines.append("\nSections to update:")
+        buf.write("\nSections to update:\n")
         for section in update_analysis['sections_to_update']:
-            lines.append(f"  • {section}")
+            buf.write(f"  • {section}\n")
         
         if suggestions:
-            lines.append("\n" + "=" * 70)
-            lines.append("SUGGESTED UPDATES")
-            lines.append("=" * 70)
+            buf.write("\n" + "=" * 70 + "\n")
+            buf.write("SUGGESTED UPDATES\n")
+            buf.write("=" * 70 + "\n")
             
             for section_name, content in suggestions.items():
-                lines.append(f"\n## {section_name}\n")
-                lines.append(content)
+                buf.write(f"\n## {section_name}\n\n")
+                buf.write(content)
+                buf.write("\n")
     else:
-        lines.append("\n✓ Context appears current")
-        lines.append("No immediate updates needed")
+        buf.write("\n✓ Context appears current\n")
+        buf.write("No immediate updates needed\n")
     
-    lines.append("\n" + "=" * 70)
-    return "\n".join(lines)
+    buf.write("\n" + "=" * 70)
+    return buf.getvalue()
 
 def update_context_file(context_file: Path, suggestions: Dict, existing_context: str) -> bool:
     """Update context file with new information."""
@@ -262,7 +349,7 @@ def update_context_file(context_file: Path, suggestions: Dict, existing_context:
     
     # Write back
     try:
-        context_file.write_text(updated_content)
+        context_file.write_bytes(updated_content.encode('utf-8'))
         return True
     except Exception as e:
         print(f"Error writing context file: {e}")
@@ -299,11 +386,15 @@ def main():
     context_file = dir_path / 'claude.md'
     
     # Analyze current state
-    print("Analyzing directory..." if args.verbose else "", end='')
     recent_changes = get_recent_changes(dir_path)
-    current_patterns = analyze_code_patterns(dir_path)
+    # Skip the per-file scan only when git history shows nothing changed in
+    # the window; an empty summary means there was no history to consult
+    summary = recent_changes['summary']
+    if args.force or not summary or any(summary.values()):
+        current_patterns = analyze_code_patterns(dir_path)
+    else:
+        current_patterns = {'file_types': {}, 'common_imports': [], 'frameworks_detected': []}
     existing_context = read_existing_context(context_file)
-    print(" Done." if args.verbose else "")
     
     # Determine if update needed
     update_analysis = needs_update(existing_context, current_patterns, recent_changes)
@@ -315,9 +406,11 @@ def main():
     # Generate suggestions
     suggestions = generate_updated_sections(existing_context, current_patterns, recent_changes)
     
-    # Output report
+    # Output progress line and report in a single write
     report = format_update_report(dir_path, update_analysis, suggestions, args.analyze_only)
-    print(report)
+    progress = "Analyzing directory... Done." if args.verbose else ""
+    sys.stdout.write(f"{progress}\n{report}\n")
+    sys.stdout.flush()
     
     # Perform update if not analyze-only
     if update_analysis['should_update'] and not args.analyze_only:
@@ -17,64 +17,158 @@ Examples:
 import os
 import sys
 import argparse
+import atexit
+import functools
+import io
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict
+from typing import List, Dict, Iterable, Optional, Set, Tuple
 import re
 
+from tree_walk import is_ignored_dir, iter_tree
 
-def find_claude_md_files(root_path: Path) -> List[Path]:
-    """Find all claude.md files, maintaining relative paths."""
-    claude_md_files = []
+# Section headers whose first line serves as the overview
+_OVERVIEW_HEADER_RE = re.compile(r'^##?\s+(Overview|Purpose)', re.IGNORECASE)
+
+
+def _git_list_claude_md(root_path: Path) -> Optional[List[Path]]:
+    """List claude.md files from the git index, or None if not in a git repo."""
+    try:
+        result = subprocess.run(
+            ['git', '-C', str(root_path), 'ls-files', '-z', '--cached', '--others',
+             '--exclude-standard', '--', 'claude.md', '*/claude.md'],
+            capture_output=True
+        )
+    except OSError:
+        return None
     
-    for dirpath, dirnames, filenames in os.walk(root_path):
-        # Skip common ignored directories
-        dirnames[:] = [d for d in dirnames if not d.startswith('.') and d not in {
-            'node_modules', '__pycache__', 'venv', 'env', 'dist', 'build'
-        }]
-        
-        if 'claude.md' in filenames:
-            full_path = Path(dirpath) / 'claude.md'
+    if result.returncode != 0:
+        return None
+    
+    claude_md_files = []
+    for rel in result.stdout.split(b'\0'):
+        if not rel:
+            continue
+        rel_path = os.fsdecode(rel)
+        if any(is_ignored_dir(part) for part in rel_path.split('/')[:-1]):
+            continue
+        full_path = root_path / rel_path
+        # Tracked files may have been deleted from the working tree
+        if full_path.is_file():
             claude_md_files.append(full_path)
     
-    return sorted(claude_md_files)
+    return claude_md_files
 
 
-def extract_title_and_overview(file_path: Path) -> Dict[str, str]:
-    """Extract the title and first line of overview from a claude.md file."""
+def _walk_for_claude_md(top: str) -> List[Path]:
+    """Walk one subtree for claude.md files, skipping ignored directories."""
+    claude_md_files = []
+    
+    for dirpath, files in iter_tree(top, is_ignored_dir):
+        if any(entry.name == 'claude.md' for entry in files):
+            claude_md_files.append(Path(dirpath) / 'claude.md')
+    
+    return claude_md_files
+
+
+def _walk_claude_md_parallel(root_path: Path) -> List[Path]:
+    """Walk the tree for claude.md files with one thread per top-level directory.
+    
+    Directory reads are I/O bound, so concurrent walks overlap their waits
+    on cold filesystems.
+    """
+    claude_md_files = []
+    subdirs = []
     try:
-        with open(file_path, 'r') as f:
-            content = f.read()
-        
-        lines = content.split('\n')
+        with os.scandir(root_path) as entries:
+            for entry in entries:
+                # Like os.walk, don't descend into symlinked directories
+                if entry.is_dir(follow_symlinks=False):
+                    if not is_ignored_dir(entry.name):
+                        subdirs.append(entry.path)
+                elif entry.name == 'claude.md':
+                    claude_md_files.append(Path(root_path) / entry.name)
+    except OSError:
+        return claude_md_files
+    
+    if subdirs:
+        with ThreadPoolExecutor(max_workers=min(16, os.cpu_count() or 1, len(subdirs))) as executor:
+            for found in executor.map(_walk_for_claude_md, subdirs):
+                claude_md_files.extend(found)
+    
+    return claude_md_files
+
+
+def find_claude_md_files(root_path: Path) -> List[Path]:
+    """Find all claude.md files, maintaining relative paths.
+    
+    The result is sorted once here; the index formats rely on that order.
+    """
+    # Fast path: git already knows every tracked and untracked-unignored file
+    claude_md_files = _git_list_claude_md(root_path)
+    
+    if claude_md_files is None:
+        claude_md_files = _walk_claude_md_parallel(root_path)
+    
+    # Sorting on the parts tuples gives Path ordering without Path.__lt__ per comparison
+    claude_md_files.sort(key=lambda p: p.parts)
+    return claude_md_files
+
+
+def _parse_title_and_overview(lines: Iterable[str]) -> Dict[str, str]:
+    """Extract the title and first line of overview from claude.md lines.
+    
+    Consumes lines only until both the title (first H1 header) and the first
+    meaningful line after the Overview section are known.
+    """
+    title = None
+    overview = None
+    in_overview = False
+    overview_done = False
+    
+    for line in lines:
+        line = line.rstrip('\r\n')
         
-        # Extract title (first H1 header)
-        title = None
-        for line in lines:
-            if line.startswith('# '):
-                title = line[2:].strip()
-                break
+        if title is None and line.startswith('# '):
+            title = line[2:].strip()
         
-        # Extract first meaningful line after Overview section
-        overview = None
-        in_overview = False
-        for line in lines:
-            if re.match(r'^##?\s+(Overview|Purpose)', line, re.IGNORECASE):
+        if not overview_done:
+            if _OVERVIEW_HEADER_RE.match(line):
                 in_overview = True
-                continue
-            if in_overview:
+            elif in_overview:
                 stripped = line.strip()
                 # Skip empty lines and comments
                 if stripped and not stripped.startswith('<!--') and not stripped.startswith('#'):
                     overview = stripped
-                    break
+                    overview_done = True
                 # Stop at next section
-                if stripped.startswith('##'):
-                    break
+                elif stripped.startswith('##'):
+                    overview_done = True
         
-        return {
-            'title': title or 'Untitled',
-            'overview': overview or 'No overview available'
-        }
+        if title is not None and overview_done:
+            break
+    
+    return {
+        'title': title or 'Untitled',
+        'overview': overview or 'No overview available'
+    }
+
+
+@functools.lru_cache(maxsize=4096)
+def _extract_cached(path_str: str, mtime_ns: int) -> Tuple[str, str]:
+    """Parse one version of a claude.md file; mtime_ns keys out stale entries."""
+    with open(path_str, 'rb') as f:
+        metadata = _parse_title_and_overview(line.decode('utf-8', 'replace') for line in f)
+    return metadata['title'], metadata['overview']
+
+
+def extract_title_and_overview(file_path: Path) -> Dict[str, str]:
+    """Extract the title and first line of overview from a claude.md file."""
+    try:
+        path_str = os.fspath(file_path)
+        title, overview = _extract_cached(path_str, os.stat(path_str).st_mtime_ns)
+        return {'title': title, 'overview': overview}
     except Exception as e:
         return {
             'title': 'Error reading file',
@@ -82,9 +176,125 @@ def extract_title_and_overview(file_path: Path) -> Dict[str, str]:
         }
 
 
+def _git_dirty_claude_md(root_path: Path) -> Optional[Set[str]]:
+    """Relative paths of claude.md files differing from HEAD, or None outside git."""
+    try:
+        result = subprocess.run(
+            ['git', '-C', str(root_path), 'diff', '--relative', '--name-only', '-z',
+             'HEAD', '--', 'claude.md', '*/claude.md'],
+            capture_output=True
+        )
+    except OSError:
+        return None
+    
+    if result.returncode != 0:
+        return None
+    
+    return {os.fsdecode(rel) for rel in result.stdout.split(b'\0') if rel}
+
+
+class GitBatch:
+    """A long-lived `git cat-file --batch` process for reading blobs.
+    
+    Use GitBatch.for_repo() so each repository shares one process.
+    """
+    
+    _instances: Dict[str, 'GitBatch'] = {}
+    
+    def __init__(self, repo_root: str):
+        self.proc = subprocess.Popen(
+            ['git', '-C', repo_root, 'cat-file', '--batch'],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL
+        )
+    
+    @classmethod
+    def for_repo(cls, repo_root: Path) -> 'GitBatch':
+        """Get the shared GitBatch for a repository, starting it if needed."""
+        key = str(Path(repo_root).resolve())
+        batch = cls._instances.get(key)
+        if batch is None or batch.proc.poll() is not None:
+            batch = cls._instances[key] = cls(key)
+        return batch
+    
+    def read_blob(self, ref_path: str) -> Optional[bytes]:
+        """Read an object such as 'HEAD:./path', or None if git can't resolve it."""
+        try:
+            self.proc.stdin.write(ref_path.encode() + b'\n')
+            self.proc.stdin.flush()
+            
+            # Response is "<sha> <type> <size>\n<data>\n", or "<ref> missing\n"
+            header = self.proc.stdout.readline()
+            if not header or header.endswith((b' missing\n', b' ambiguous\n')):
+                return None
+            size = int(header.rsplit(b' ', 1)[1])
+            data = self.proc.stdout.read(size)
+            self.proc.stdout.read(1)
+            return data
+        except (OSError, ValueError):
+            return None
+    
+    def close(self):
+        """Stop the git process."""
+        try:
+            self.proc.stdin.close()
+        except OSError:
+            pass
+        self.proc.wait()
+        self.proc.stdout.close()
+    
+    @classmethod
+    def close_all(cls):
+        """Stop every shared git process."""
+        for batch in cls._instances.values():
+            batch.close()
+        cls._instances.clear()
+
+
+atexit.register(GitBatch.close_all)
+
+
+def _batch_read_blobs(repo_path: Path, rel_paths: List[str]) -> Dict[str, str]:
+    """Read the HEAD contents of several files through the repository's GitBatch.
+    
+    Paths git cannot resolve (e.g. untracked files) are left out of the result.
+    """
+    if not rel_paths:
+        return {}
+    
+    batch = GitBatch.for_repo(repo_path)
+    blobs = {}
+    for rel in rel_paths:
+        data = batch.read_blob(f'HEAD:./{rel}')
+        if data is not None:
+            blobs[rel] = data.decode('utf-8', 'replace')
+    
+    return blobs
+
+
+def _load_metadata(root_path: Path, files: List[Path]) -> Dict[Path, Dict[str, str]]:
+    """Extract title and overview for every file, reading clean files from git in one batch."""
+    rel_paths = {file_path: file_path.relative_to(root_path).as_posix() for file_path in files}
+    
+    # Files with uncommitted changes must come from the working tree
+    blobs = {}
+    dirty = _git_dirty_claude_md(root_path)
+    if dirty is not None:
+        blobs = _batch_read_blobs(root_path, [rel for rel in rel_paths.values() if rel not in dirty])
+    
+    return {
+        file_path: _parse_title_and_overview(io.StringIO(blobs[rel])) if rel in blobs
+        else extract_title_and_overview(file_path)
+        for file_path, rel in rel_paths.items()
+    }
+
+
 def create_tree_format(root_path: Path, files: List[Path]) -> str:
     """Create a tree-style index."""
-    lines = ["# Claude.md Index", "", "Repository documentation structure:", ""]
+    buf = io.StringIO()
+    buf.write("# Claude.md Index\n\nRepository documentation structure:\n")
+    metadata_by_file = _load_metadata(root_path, files)
     
     # Group files by directory depth
     for file_path in files:
@@ -95,33 +305,33 @@ def create_tree_format(root_path: Path, files: List[Path]) -> str:
         depth = len(dir_path.parts)
         indent = "  " * depth
         
-        # Get metadata
-        metadata = extract_title_and_overview(file_path)
+        metadata = metadata_by_file[file_path]
         
         # Format entry
         dir_display = str(dir_path) if str(dir_path) != '.' else '(root)'
-        lines.append(f"{indent}📁 **{dir_display}** ([claude.md]({rel_path}))")
-        lines.append(f"{indent}   {metadata['title']}")
-        lines.append("")
+        buf.write(f"\n{indent}📁 **{dir_display}** ([claude.md]({rel_path}))\n")
+        buf.write(f"{indent}   {metadata['title']}\n")
     
-    return "\n".join(lines)
+    return buf.getvalue()
 
 
 def create_table_format(root_path: Path, files: List[Path]) -> str:
     """Create a table-style index."""
-    lines = [
-        "# Claude.md Index",
-        "",
-        "| Directory | Title | Overview |",
+    buf = io.StringIO()
+    buf.write(
+        "# Claude.md Index\n"
+        "\n"
+        "| Directory | Title | Overview |\n"
         "|-----------|-------|----------|"
-    ]
+    )
+    metadata_by_file = _load_metadata(root_path, files)
     
     for file_path in files:
         rel_path = file_path.relative_to(root_path)
         dir_path = rel_path.parent
         dir_display = str(dir_path) if str(dir_path) != '.' else '(root)'
         
-        metadata = extract_title_and_overview(file_path)
+        metadata = metadata_by_file[file_path]
         
         # Truncate overview if too long
         overview = metadata['overview']
@@ -132,34 +342,37 @@ def create_table_format(root_path: Path, files: List[Path]) -> str:
         title = metadata['title'].replace('|', '\\|')
         overview = overview.replace('|', '\\|')
         
-        lines.append(f"| [{dir_display}]({rel_path}) | {title} | {overview} |")
+        buf.write(f"\n| [{dir_display}]({rel_path}) | {title} | {overview} |")
     
-    return "\n".join(lines)
+    return buf.getvalue()
 
 
 def create_detailed_format(root_path: Path, files: List[Path]) -> str:
     """Create a detailed list-style index."""
-    lines = ["# Claude.md Index", "", "Complete documentation map for this repository.", ""]
+    buf = io.StringIO()
+    buf.write("# Claude.md Index\n\nComplete documentation map for this repository.\n")
+    metadata_by_file = _load_metadata(root_path, files)
     
     for i, file_path in enumerate(files, 1):
         rel_path = file_path.relative_to(root_path)
         dir_path = rel_path.parent
         dir_display = str(dir_path) if str(dir_path) != '.' else '(root)'
         
-        metadata = extract_title_and_overview(file_path)
+        metadata = metadata_by_file[file_path]
         
-        lines.append(f"## {i}. {dir_display}")
-        lines.append("")
-        lines.append(f"**File:** [{rel_path}]({rel_path})")
-        lines.append("")
-        lines.append(f"**Title:** {metadata['title']}")
-        lines.append("")
-        lines.append(f"**Overview:** {metadata['overview']}")
-        lines.append("")
-        lines.append("---")
-        lines.append("")
+        buf.write(
+            f"\n## {i}. {dir_display}\n"
+            "\n"
+            f"**File:** [{rel_path}]({rel_path})\n"
+            "\n"
+            f"**Title:** {metadata['title']}\n"
+            "\n"
+            f"**Overview:** {metadata['overview']}\n"
+            "\n"
+            "---\n"
+        )
     
-    return "\n".join(lines)
+    return buf.getvalue()
 
 
 def main():
@@ -216,8 +429,7 @@ def main():
     
     # Write output
     output_path = repo_path / args.output
-    with open(output_path, 'w') as f:
-        f.write(content)
+    output_path.write_bytes(content.encode('utf-8'))
     
     print(f"✅ Created index: {output_path}")
 
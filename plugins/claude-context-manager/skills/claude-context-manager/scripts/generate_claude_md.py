@@ -17,25 +17,29 @@ Examples:
 import os
 import sys
 import argparse
+import heapq
+import io
 from pathlib import Path
 from collections import defaultdict
 from typing import List, Dict, Set
 import subprocess
+import re
 
-IGNORE_DIRS = {
+IGNORE_DIRS = frozenset({
     '.git', '.github', 'node_modules', '__pycache__', '.pytest_cache',
     'venv', 'env', '.venv', 'dist', 'build', '.egg-info', 'coverage'
-}
+})
 
 
 def analyze_directory(dir_path: Path, depth: int = 0, max_depth: int = 1) -> Dict:
     """Analyze directory structure and content."""
     analysis = {
         'path': dir_path,
-        'files_by_type': defaultdict(list),
+        'files_by_type': defaultdict(int),  # extension -> file count
         'subdirs': [],
         'total_files': 0,
-        'key_files': []
+        'key_files': [],
+        'has_test_files': False
     }
     
     # Key files to look for
@@ -49,69 +53,82 @@ def analyze_directory(dir_path: Path, depth: int = 0, max_depth: int = 1) -> Dic
     }
     
     try:
-        items = list(dir_path.iterdir())
+        with os.scandir(dir_path) as it:
+            entries = list(it)
     except PermissionError:
         return analysis
     
-    for item in items:
-        if item.name.startswith('.') and item.name not in {'.gitignore', '.env.example'}:
+    # DirEntry answers is_file()/is_dir() from the directory listing, no extra stat
+    for entry in entries:
+        name = entry.name
+        if name.startswith('.') and name not in {'.gitignore', '.env.example'}:
             continue
         
-        if item.is_file():
+        if entry.is_file():
             analysis['total_files'] += 1
-            ext = item.suffix or 'no_extension'
-            analysis['files_by_type'][ext].append(item.name)
+            # Same as Path.suffix: a trailing dot is not a suffix
+            ext = os.path.splitext(name)[1].rstrip('.') or 'no_extension'
+            analysis['files_by_type'][ext] += 1
+            if '.test.py' in name or '.test.js' in name:
+                analysis['has_test_files'] = True
             
-            if item.name in key_filenames:
-                analysis['key_files'].append(item.name)
+            if name in key_filenames:
+                analysis['key_files'].append(name)
         
-        elif item.is_dir() and item.name not in IGNORE_DIRS:
-            analysis['subdirs'].append(item.name)
+        elif entry.is_dir() and name not in IGNORE_DIRS:
+            analysis['subdirs'].append(name)
     
     return analysis
 
 
+# Common directory name patterns, in priority order
+DIRECTORY_PURPOSES = {
+    'src': 'source code',
+    'lib': 'library code',
+    'app': 'application code',
+    'api': 'API implementation',
+    'tests': 'test suite',
+    'test': 'test suite',
+    'docs': 'documentation',
+    'documentation': 'documentation',
+    'scripts': 'utility scripts',
+    'utils': 'utility functions',
+    'helpers': 'helper functions',
+    'models': 'data models',
+    'views': 'view templates',
+    'controllers': 'controllers',
+    'routes': 'route definitions',
+    'components': 'reusable components',
+    'services': 'service layer',
+    'middleware': 'middleware functions',
+    'config': 'configuration files',
+    'public': 'public assets',
+    'static': 'static assets',
+    'assets': 'static assets',
+    'migrations': 'database migrations',
+    'fixtures': 'test fixtures',
+    'examples': 'example code',
+}
+_PURPOSE_RANK = {pattern: rank for rank, pattern in enumerate(DIRECTORY_PURPOSES)}
+
+# Zero-width so every occurrence is seen, even overlapping ones; at each
+# position the alternation reports the highest-priority pattern starting there
+_PURPOSE_RE = re.compile('(?=(' + '|'.join(map(re.escape, DIRECTORY_PURPOSES)) + '))')
+
+
 def infer_directory_purpose(dir_name: str, analysis: Dict) -> str:
     """Infer the purpose of a directory based on its name and contents."""
     dir_name_lower = dir_name.lower()
     
-    # Common patterns
-    purposes = {
-        'src': 'source code',
-        'lib': 'library code',
-        'app': 'application code',
-        'api': 'API implementation',
-        'tests': 'test suite',
-        'test': 'test suite',
-        'docs': 'documentation',
-        'documentation': 'documentation',
-        'scripts': 'utility scripts',
-        'utils': 'utility functions',
-        'helpers': 'helper functions',
-        'models': 'data models',
-        'views': 'view templates',
-        'controllers': 'controllers',
-        'routes': 'route definitions',
-        'components': 'reusable components',
-        'services': 'service layer',
-        'middleware': 'middleware functions',
-        'config': 'configuration files',
-        'public': 'public assets',
-        'static': 'static assets',
-        'assets': 'static assets',
-        'migrations': 'database migrations',
-        'fixtures': 'test fixtures',
-        'examples': 'example code',
-    }
-    
-    for pattern, purpose in purposes.items():
-        if pattern in dir_name_lower:
-            return purpose
+    # First pattern in DIRECTORY_PURPOSES order that occurs anywhere in the name
+    found = _PURPOSE_RE.findall(dir_name_lower)
+    if found:
+        return DIRECTORY_PURPOSES[min(found, key=_PURPOSE_RANK.__getitem__)]
     
     # Infer from file types
     file_types = set(analysis['files_by_type'].keys())
     
-    if '.test.py' in str(analysis['files_by_type']) or '.test.js' in str(analysis['files_by_type']):
+    if analysis.get('has_test_files'):
         return 'test suite'
     
     if any('.md' in ext or '.rst' in ext for ext in file_types):
@@ -127,80 +144,68 @@ def generate_claude_md(dir_path: Path, analyze_depth: int = 1) -> str:
     purpose = infer_directory_purpose(dir_name, analysis)
     
     # Build the claude.md content
-    content = []
+    buf = io.StringIO()
     
-    # Header
-    content.append(f"# {dir_name}/")
-    content.append("")
-    
-    # Purpose section
-    content.append(f"This directory contains the {purpose}.")
-    content.append("")
-    
-    # Overview section
-    content.append("## Overview")
-    content.append("")
-    content.append(f"<!-- TODO: Add detailed description of what this directory contains and its role in the project -->")
-    content.append("")
+    # Header, purpose and overview sections
+    buf.write(
+        f"# {dir_name}/\n"
+        "\n"
+        f"This directory contains the {purpose}.\n"
+        "\n"
+        "## Overview\n"
+        "\n"
+        "<!-- TODO: Add detailed description of what this directory contains and its role in the project -->\n"
+        "\n"
+    )
     
     # Structure section if there are subdirectories
     if analysis['subdirs']:
-        content.append("## Directory Structure")
-        content.append("")
-        content.append("```")
-        content.append(f"{dir_name}/")
-        for subdir in sorted(analysis['subdirs'])[:10]:  # Limit to first 10
-            content.append(f"├── {subdir}/")
+        buf.write("## Directory Structure\n\n```\n")
+        buf.write(f"{dir_name}/\n")
+        for subdir in heapq.nsmallest(10, analysis['subdirs']):  # Limit to first 10
+            buf.write(f"├── {subdir}/\n")
         if len(analysis['subdirs']) > 10:
-            content.append(f"└── ... ({len(analysis['subdirs']) - 10} more)")
-        content.append("```")
-        content.append("")
+            buf.write(f"└── ... ({len(analysis['subdirs']) - 10} more)\n")
+        buf.write("```\n\n")
     
     # Key files section
     if analysis['key_files']:
-        content.append("## Key Files")
-        content.append("")
+        buf.write("## Key Files\n\n")
         for key_file in sorted(analysis['key_files']):
-            content.append(f"- **{key_file}**: <!-- TODO: Describe purpose -->")
-        content.append("")
+            buf.write(f"- **{key_file}**: <!-- TODO: Describe purpose -->\n")
+        buf.write("\n")
     
     # File types section
     if analysis['files_by_type']:
-        content.append("## File Types")
-        content.append("")
-        for ext, files in sorted(analysis['files_by_type'].items()):
+        buf.write("## File Types\n\n")
+        for ext, count in sorted(analysis['files_by_type'].items()):
             if ext != 'no_extension':
-                content.append(f"- **{ext}** ({len(files)} files): <!-- TODO: Describe purpose -->")
-        content.append("")
-    
-    # Important patterns section
-    content.append("## Important Patterns")
-    content.append("")
-    content.append("<!-- TODO: Document key patterns, conventions, or architectural decisions -->")
-    content.append("")
-    content.append("- Pattern 1: Description")
-    content.append("- Pattern 2: Description")
-    content.append("")
+                buf.write(f"- **{ext}** ({count} files): <!-- TODO: Describe purpose -->\n")
+        buf.write("\n")
     
-    # Dependencies section
-    content.append("## Dependencies")
-    content.append("")
-    content.append("<!-- TODO: List key dependencies or relationships with other parts of the codebase -->")
-    content.append("")
-    
-    # Usage/Entry Points section
-    content.append("## Usage")
-    content.append("")
-    content.append("<!-- TODO: Explain how to use or interact with code in this directory -->")
-    content.append("")
-    
-    # Notes section
-    content.append("## Notes")
-    content.append("")
-    content.append("<!-- TODO: Add any additional context, gotchas, or important information -->")
-    content.append("")
+    # Patterns, dependencies, usage and notes sections are static placeholders
+    buf.write(
+        "## Important Patterns\n"
+        "\n"
+        "<!-- TODO: Document key patterns, conventions, or architectural decisions -->\n"
+        "\n"
+        "- Pattern 1: Description\n"
+        "- Pattern 2: Description\n"
+        "\n"
+        "## Dependencies\n"
+        "\n"
+        "<!-- TODO: List key dependencies or relationships with other parts of the codebase -->\n"
+        "\n"
+        "## Usage\n"
+        "\n"
+        "<!-- TODO: Explain how to use or interact with code in this directory -->\n"
+        "\n"
+        "## Notes\n"
+        "\n"
+        "<!-- TODO: Add any additional context, gotchas, or important information -->\n"
+    )
     
-    return "\n".join(content)
+    return buf.getvalue()
 
 
 def main():
@@ -251,8 +256,7 @@ def main():
     print(f"Analyzing directory: {dir_path}")
     content = generate_claude_md(dir_path, args.analyze_depth)
     
-    with open(output_path, 'w') as f:
-        f.write(content)
+    output_path.write_bytes(content.encode('utf-8'))
     
     print(f"✅ Generated {output_path}")
     print(f"\nNext steps:")
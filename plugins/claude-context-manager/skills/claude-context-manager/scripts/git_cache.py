@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Git Dir Cache
+
+Shared by the claude.md scripts to cache results inside the git dir, one
+JSON file per entry, so nothing is written to the working tree.
+"""
+
+import json
+import os
+import subprocess
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+# Directory inside the git dir holding the cache entries
+CACHE_DIR = 'ccmp-cache'
+
+
+def git_state(path: Path, *git_paths: str) -> Optional[Tuple[Any, ...]]:
+    """Get HEAD, the cache directory and any other git paths in one rev-parse call.
+    
+    Returns (head, cache_dir, *paths), with paths resolved against path, or
+    None outside a git repository or before the first commit.
+    """
+    args = ['git', 'rev-parse', 'HEAD']
+    for git_path in (CACHE_DIR, *git_paths):
+        args += ['--git-path', git_path]
+    try:
+        result = subprocess.run(args, cwd=path, capture_output=True, text=True)
+    except OSError:
+        return None
+    if result.returncode != 0:
+        return None
+    
+    head, *resolved = result.stdout.splitlines()
+    return (head, *(path / p for p in resolved))
+
+
+def load(cache_dir: Path, kind: str, name: str, key: Dict[str, Any]) -> Optional[Any]:
+    """Return the payload cached under kind and name if every key field matches."""
+    try:
+        with open(cache_dir / f'{kind}_{name}.json') as f:
+            cached = json.load(f)
+        if all(cached.get(field) == value for field, value in key.items()):
+            return cached['payload']
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        pass
+    return None
+
+
+def store(cache_dir: Path, kind: str, name: str, key: Dict[str, Any], payload: Any,
+          max_age: float):
+    """Write a cache entry atomically and prune old entries of the same kind.
+    
+    Entries of this kind not written within max_age seconds are deleted.
+    Failures are ignored; the cache is only an optimization.
+    """
+    cache_file = cache_dir / f'{kind}_{name}.json'
+    try:
+        cache_dir.mkdir(exist_ok=True)
+        tmp_file = cache_file.with_suffix(f'.{os.getpid()}.tmp')
+        with open(tmp_file, 'w') as f:
+            json.dump({**key, 'payload': payload}, f)
+        os.replace(tmp_file, cache_file)
+        
+        cutoff = time.time() - max_age
+        with os.scandir(cache_dir) as entries:
+            for entry in entries:
+                if entry.name.startswith(f'{kind}_') and entry.stat().st_mtime < cutoff:
+                    os.unlink(entry.path)
+    except OSError:
+        pass
@@ -8,62 +8,184 @@ context health and identify what needs attention.
 Outputs structured data that Claude can interpret and act on.
 
 Usage:
-    python monitor.py <repo_path> [--format json|text]
+    python monitor.py <repo_path> [--format json|text] [--stream]
 """
 
 import os
 import sys
 import json
 import argparse
+import hashlib
+import posixpath
+import time
 from pathlib import Path
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional
+from typing import Callable, List, Dict, Optional, Set
+from bisect import bisect_left
+from concurrent.futures import ThreadPoolExecutor
 import subprocess
 
-def get_git_last_modified(file_path: Path) -> Optional[datetime]:
-    """Get the last git modification time for a file."""
-    try:
-        result = subprocess.run(
-            ['git', 'log', '-1', '--format=%ai', str(file_path)],
-            cwd=file_path.parent,
-            capture_output=True,
-            text=True
-        )
-        if result.returncode == 0 and result.stdout.strip():
-            return datetime.fromisoformat(result.stdout.strip().rsplit(' ', 1)[0])
-    except:
-        pass
-    return None
+import git_cache
+from tree_walk import is_ignored_dir, iter_tree
+
+def _context_dirs_above(path: str, context_dirs: Set[str]) -> Set[str]:
+    """The indexed directories containing a path, '' being the repository root."""
+    found = set()
+    while path:
+        cut = path.rfind('/')
+        path = path[:cut] if cut != -1 else ''
+        if path in context_dirs:
+            found.add(path)
+    return found
+
+# Rewrite the commit-graph once it is older than this
+COMMIT_GRAPH_MAX_AGE = timedelta(days=1)
 
-def get_directory_last_modified(dir_path: Path) -> Optional[datetime]:
-    """Get the last git modification time for any file in directory."""
+# Bump when the cached git index layout changes
+GIT_INDEX_VERSION = 3
+
+# Cached indexes not written for this long are deleted on the next write
+GIT_INDEX_MAX_AGE = timedelta(days=7)
+
+def _ensure_commit_graph(repo_path: Path, graph_path: Path):
+    """Write git's commit-graph (with changed-path Bloom filters) if missing or stale.
+    
+    The history walk then reads commits from the graph instead of parsing
+    each commit object.
+    """
     try:
-        result = subprocess.run(
-            ['git', 'log', '-1', '--format=%ai', '--', str(dir_path)],
-            cwd=dir_path if dir_path.is_dir() else dir_path.parent,
-            capture_output=True,
-            text=True
+        age = datetime.now() - datetime.fromtimestamp(graph_path.stat().st_mtime)
+        if age < COMMIT_GRAPH_MAX_AGE:
+            return
+    except OSError:
+        pass  # No commit-graph yet
+    
+    try:
+        subprocess.run(
+            ['git', 'commit-graph', 'write', '--reachable', '--changed-paths', '--no-progress'],
+            cwd=repo_path,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL
         )
-        if result.returncode == 0 and result.stdout.strip():
-            return datetime.fromisoformat(result.stdout.strip().rsplit(' ', 1)[0])
-    except:
+    except OSError:
         pass
-    return None
 
-def count_commits_since(path: Path, since_date: datetime) -> int:
-    """Count commits affecting path since a given date."""
+def _in_git_repo(path: Path) -> bool:
+    """Whether path lies in a git work tree, going by a .git entry above it."""
+    path = path.resolve()
+    return any((d / '.git').exists() for d in (path, *path.parents))
+
+def _load_git_index(repo_path: Path, head: str, cache_dir: Path, graph_path: Path,
+                    rel_files: List[str]) -> Dict:
+    """Get the git index for these claude.md files at HEAD, cached across runs.
+    
+    History only changes when HEAD moves, so a cached index is reused as is.
+    Each monitored root and file set keeps a single entry, replaced when
+    HEAD moves.
+    """
+    # The index depends on the monitored root and its claude.md files too
+    key = hashlib.sha1(json.dumps([GIT_INDEX_VERSION, str(repo_path), rel_files]).encode()).hexdigest()[:12]
+    git_index = git_cache.load(cache_dir, 'monitor', key, {'head': head})
+    if git_index is not None:
+        return git_index
+    
+    _ensure_commit_graph(repo_path, graph_path)
+    context_dirs = {posixpath.dirname(rel) for rel in rel_files}
+    git_index = _build_git_index(repo_path, context_dirs)
+    # Only the claude.md files themselves are ever looked up
+    git_index['file_last_modified'] = {
+        rel: git_index['file_last_modified'][rel]
+        for rel in rel_files if rel in git_index['file_last_modified']
+    }
+    
+    git_cache.store(cache_dir, 'monitor', key, {'head': head}, git_index,
+                    GIT_INDEX_MAX_AGE.total_seconds())
+    
+    return git_index
+
+def _build_git_index(repo_path: Path, context_dirs: Set[str]) -> Dict:
+    """Collect commit history for files and context directories in one git log pass.
+    
+    Paths are relative to repo_path in POSIX form, with '' for repo_path
+    itself. Directories are only indexed if listed in context_dirs, and each
+    counts the commits touching anything beneath it. As with `git log -- path`,
+    a merge touches a path only if it differs from every parent there.
+    """
+    file_last_modified = {}  # path -> author timestamp of the newest commit touching it
+    dir_last_modified = {}   # dir -> author timestamp of the newest commit touching it
+    dir_commit_times = {d: [] for d in context_dirs}  # dir -> commit timestamps
+    
+    def record(commit_time: int, author_time: int, parent_count: int, diffs: List[Set[str]]):
+        # One diff per parent (just one for ordinary commits). git leaves out a
+        # merge's diffs that are empty below repo_path, and an empty diff means
+        # the merge touched nothing there.
+        if len(diffs) < parent_count:
+            return
+        files = set.intersection(*diffs)
+        dirs = set.intersection(*[
+            set().union(*[_context_dirs_above(path, context_dirs) for path in diff])
+            for diff in diffs
+        ])
+        for path in files:
+            file_last_modified.setdefault(path, author_time)
+        for d in dirs:
+            dir_commit_times[d].append(commit_time)
+            dir_last_modified.setdefault(d, author_time)
+    
     try:
-        result = subprocess.run(
-            ['git', 'rev-list', '--count', f'--since={since_date.isoformat()}', 'HEAD', '--', str(path)],
-            cwd=path if path.is_dir() else path.parent,
-            capture_output=True,
-            text=True
+        # Newest first; each diff is a "\0<hash> <committer ts> <author ts> <parents>"
+        # line followed by the changed paths, and -m repeats a merge once per parent
+        proc = subprocess.Popen(
+            ['git', '-c', 'core.quotePath=false', 'log', '-m', '--relative', '--name-only',
+             '--format=%x00%H %ct %at %P', 'HEAD'],
+            cwd=repo_path,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            errors='surrogateescape',
+            # Trust the commit-graph without checking each commit's object exists
+            env={**os.environ, 'GIT_COMMIT_GRAPH_PARANOIA': '0'}
         )
-        if result.returncode == 0:
-            return int(result.stdout.strip())
-    except:
-        pass
-    return 0
+    except OSError:
+        proc = None
+    
+    if proc is not None:
+        with proc:
+            commit = None
+            commit_time = 0
+            parent_count = 1
+            author_time = 0
+            diffs = []
+            for line in proc.stdout:
+                line = line.rstrip('\n')
+                if not line:
+                    continue
+                if line[0] != '\0':
+                    diffs[-1].add(line)
+                    continue
+                
+                sha, timestamp, author_timestamp, *parents = line[1:].split()
+                if sha != commit:
+                    if commit is not None:
+                        record(commit_time, author_time, parent_count, diffs)
+                    commit = sha
+                    commit_time = int(timestamp)
+                    author_time = int(author_timestamp)
+                    parent_count = max(len(parents), 1)
+                    diffs = []
+                diffs.append(set())
+            
+            if commit is not None:
+                record(commit_time, author_time, parent_count, diffs)
+    
+    for times in dir_commit_times.values():
+        times.sort()
+    
+    return {
+        'file_last_modified': file_last_modified,
+        'dir_last_modified': dir_last_modified,
+        'dir_commit_times': dir_commit_times
+    }
 
 def calculate_staleness_score(context_age_days: int, commits_since_update: int) -> Dict:
     """Calculate staleness score and priority."""
@@ -97,73 +219,101 @@ def calculate_staleness_score(context_age_days: int, commits_since_update: int)
 def find_claude_md_files(root_path: Path) -> List[Path]:
     """Find all claude.md files."""
     claude_md_files = []
-    for dirpath, dirnames, filenames in os.walk(root_path):
-        dirnames[:] = [d for d in dirnames if not d.startswith('.') and d not in {
-            'node_modules', '__pycache__', 'venv', 'env', 'dist', 'build'
-        }]
-        if 'claude.md' in filenames:
+    for dirpath, files in iter_tree(os.fspath(root_path), is_ignored_dir):
+        if any(entry.name == 'claude.md' for entry in files):
             claude_md_files.append(Path(dirpath) / 'claude.md')
     return sorted(claude_md_files)
 
-def analyze_context_file(file_path: Path, root_path: Path) -> Dict:
-    """Analyze a single context file for staleness."""
-    now = datetime.now()
+def analyze_context_file(file_path: Path, root_path: Path, git_index: Dict) -> Dict:
+    """Analyze a single context file for staleness using a prebuilt git index."""
+    now = time.time()
+    
+    # Relative path for display and index lookups
+    rel_path = file_path.relative_to(root_path)
+    rel_dir = rel_path.parent.as_posix()
+    if rel_dir == '.':
+        rel_dir = ''
     
-    # Get context file last modified
-    context_modified = get_git_last_modified(file_path)
-    if not context_modified:
+    # Get context file last modified, as epoch seconds
+    context_modified = git_index['file_last_modified'].get(rel_path.as_posix())
+    if context_modified is None:
         # Fall back to filesystem mtime
-        context_modified = datetime.fromtimestamp(file_path.stat().st_mtime)
+        context_modified = file_path.stat().st_mtime
     
     # Get directory last modified
-    dir_path = file_path.parent
-    dir_modified = get_directory_last_modified(dir_path)
+    dir_modified = git_index['dir_last_modified'].get(rel_dir)
     
-    # Calculate age
-    context_age = now - context_modified
-    context_age_days = context_age.days
+    # Calculate age in whole days
+    context_age_days = int((now - context_modified) // 86400)
     
     # Count commits since context update
-    commits_since_update = count_commits_since(dir_path, context_modified)
+    commit_times = git_index['dir_commit_times'].get(rel_dir, [])
+    commits_since_update = len(commit_times) - bisect_left(commit_times, context_modified)
     
     # Calculate staleness
     staleness = calculate_staleness_score(context_age_days, commits_since_update)
     
-    # Relative path for display
-    rel_path = file_path.relative_to(root_path)
-    
     return {
         'path': str(rel_path),
         'directory': str(rel_path.parent),
         'context_age_days': context_age_days,
-        'context_last_updated': context_modified.isoformat(),
-        'directory_last_modified': dir_modified.isoformat() if dir_modified else None,
+        'context_last_updated': datetime.fromtimestamp(context_modified).isoformat(),
+        'directory_last_modified': (
+            datetime.fromtimestamp(dir_modified).isoformat() if dir_modified is not None else None
+        ),
         'commits_since_update': commits_since_update,
         'staleness': staleness,
         'needs_attention': staleness['action'] in ['UPDATE_NOW', 'UPDATE_SOON']
     }
 
-def monitor_repository(repo_path: Path) -> Dict:
-    """Monitor entire repository for context health."""
-    files = find_claude_md_files(repo_path)
-    
-    if not files:
-        return {
-            'status': 'no_context_files',
-            'message': 'No claude.md files found in repository',
-            'files': []
-        }
-    
-    analyses = [analyze_context_file(f, repo_path) for f in files]
+def monitor_repository(repo_path: Path, on_analysis: Optional[Callable[[Dict], None]] = None) -> Dict:
+    """Monitor entire repository for context health.
+    
+    on_analysis, if given, is called with each file's analysis as soon as
+    it is made.
+    """
+    # Resolve HEAD in the background while the tree is walked; git is never
+    # run outside a git repository
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        git_state = None
+        if _in_git_repo(repo_path):
+            git_state = executor.submit(git_cache.git_state, repo_path, 'objects/info/commit-graph')
+        files = find_claude_md_files(repo_path)
+        
+        if not files:
+            return {
+                'status': 'no_context_files',
+                'message': 'No claude.md files found in repository',
+                'files': []
+            }
+        
+        rel_files = [f.relative_to(repo_path).as_posix() for f in files]
+        git_state = git_state.result() if git_state else None
     
-    # Categorize by priority
-    critical = [a for a in analyses if a['staleness']['priority'] == 'critical']
-    high = [a for a in analyses if a['staleness']['priority'] == 'high']
-    medium = [a for a in analyses if a['staleness']['priority'] == 'medium']
-    low = [a for a in analyses if a['staleness']['priority'] == 'low']
+    # The expensive history walk only happens once claude.md files are found
+    if git_state:
+        git_index = _load_git_index(repo_path, *git_state, rel_files)
+    else:
+        # No history; ages come from file modification times
+        git_index = {'file_last_modified': {}, 'dir_last_modified': {}, 'dir_commit_times': {}}
+    
+    # Analyze, categorize by priority and total the staleness in one pass
+    files_by_priority = {'critical': [], 'high': [], 'medium': [], 'low': []}
+    total_staleness = 0.0
+    for f in files:
+        analysis = analyze_context_file(f, repo_path, git_index)
+        if on_analysis:
+            on_analysis(analysis)
+        staleness = analysis['staleness']
+        files_by_priority[staleness['priority']].append(analysis)
+        total_staleness += staleness['score']
+    critical = files_by_priority['critical']
+    high = files_by_priority['high']
+    medium = files_by_priority['medium']
+    low = files_by_priority['low']
     
     # Overall health score (0-100, higher is better)
-    avg_staleness = sum(a['staleness']['score'] for a in analyses) / len(analyses)
+    avg_staleness = total_staleness / len(files)
     health_score = max(0, 100 - (avg_staleness * 20))
     
     return {
@@ -171,19 +321,14 @@ def monitor_repository(repo_path: Path) -> Dict:
         'timestamp': datetime.now().isoformat(),
         'repository': str(repo_path),
         'summary': {
-            'total_files': len(analyses),
+            'total_files': len(files),
             'critical': len(critical),
             'high': len(high),
             'medium': len(medium),
             'low': len(low),
             'health_score': round(health_score, 1)
         },
-        'files': {
-            'critical': critical,
-            'high': high,
-            'medium': medium,
-            'low': low
-        },
+        'files': files_by_priority,
         'recommendations': generate_recommendations(critical, high, medium)
     }
 
@@ -265,6 +410,12 @@ def format_text_output(data: Dict) -> str:
     lines.append("\n" + "=" * 70)
     return "\n".join(lines)
 
+def _write_json_line(data: Dict):
+    """Write one NDJSON record and flush it through to the reader."""
+    json.dump(data, sys.stdout)
+    sys.stdout.write('\n')
+    sys.stdout.flush()
+
 def main():
     parser = argparse.ArgumentParser(
         description='Monitor context health and identify stale files'
@@ -276,6 +427,11 @@ def main():
         default='text',
         help='Output format (default: text)'
     )
+    parser.add_argument(
+        '--stream',
+        action='store_true',
+        help='Stream NDJSON: one line per file as it is analyzed, then a summary line'
+    )
     
     args = parser.parse_args()
     repo_path = Path(args.repo_path).resolve()
@@ -285,11 +441,15 @@ def main():
         sys.exit(1)
     
     # Analyze repository
-    results = monitor_repository(repo_path)
+    results = monitor_repository(repo_path, _write_json_line if args.stream else None)
     
     # Output results
-    if args.format == 'json':
-        print(json.dumps(results, indent=2))
+    if args.stream:
+        # Files were already written as they were analyzed
+        _write_json_line({key: value for key, value in results.items() if key != 'files'})
+    elif args.format == 'json':
+        json.dump(results, sys.stdout, indent=2)
+        sys.stdout.write('\n')
     else:
         print(format_text_output(results))
     
@@ -18,21 +18,28 @@ import os
 import sys
 import argparse
 from pathlib import Path
-from typing import List, Dict, Set
+from typing import List, Dict, Set, Tuple
 
-# Directories to ignore
-IGNORE_DIRS = {
+from tree_walk import iter_tree
+
+# Directories to ignore, in addition to every hidden (dot) directory
+IGNORE_DIRS = frozenset({
     '.git', '.github', 'node_modules', '__pycache__', '.pytest_cache',
     'venv', 'env', '.venv', 'dist', 'build', '.egg-info', 'coverage',
     '.tox', '.mypy_cache', '.ruff_cache', 'target', 'bin', 'obj'
-}
+})
 
 # File extensions to consider when calculating "significance"
-SIGNIFICANT_EXTENSIONS = {
+SIGNIFICANT_EXTENSIONS = frozenset({
     '.py', '.js', '.ts', '.jsx', '.tsx', '.java', '.go', '.rs', '.cpp',
     '.c', '.h', '.hpp', '.cs', '.rb', '.php', '.swift', '.kt', '.scala',
     '.sh', '.bash', '.md', '.yaml', '.yml', '.json', '.toml', '.xml'
-}
+})
+
+
+def _is_ignored_dir(name: str) -> bool:
+    """Whether a directory name is hidden or ignored."""
+    return name[0] == '.' or name in IGNORE_DIRS
 
 
 def scan_directory(root_path: Path, min_files: int = 2) -> Dict:
@@ -56,24 +63,27 @@ def scan_directory(root_path: Path, min_files: int = 2) -> Dict:
         }
     }
     
-    for dirpath, dirnames, filenames in os.walk(root_path):
-        # Filter out ignored directories
-        dirnames[:] = [d for d in dirnames if d not in IGNORE_DIRS]
-        
+    # Ignored directories are pruned before they are ever listed
+    for dirpath, files in iter_tree(os.fspath(root_path), _is_ignored_dir):
         results['stats']['total_dirs'] += 1
         current_path = Path(dirpath)
+        has_claude_md = False
         
-        # Check if this directory has claude.md
-        has_claude_md = 'claude.md' in filenames
-        
-        # Count significant files
-        significant_files = [
-            f for f in filenames
-            if Path(f).suffix in SIGNIFICANT_EXTENSIONS and f != 'claude.md'
-        ]
+        # Suffixes of the significant files, sliced from the name rather
+        # than through a Path per file
+        significant_suffixes = []
+        for entry in files:
+            name = entry.name
+            if name == 'claude.md':
+                has_claude_md = True
+                continue
+            dot = name.rfind('.')
+            # As with Path.suffix, a leading dot is part of the name
+            if dot > 0 and name[dot:] in SIGNIFICANT_EXTENSIONS:
+                significant_suffixes.append(name[dot:])
         
         # Determine if this directory is "significant" enough
-        is_significant = len(significant_files) >= min_files
+        is_significant = len(significant_suffixes) >= min_files
         
         if is_significant:
             results['stats']['significant_dirs'] += 1
@@ -82,8 +92,8 @@ def scan_directory(root_path: Path, min_files: int = 2) -> Dict:
             rel_path = current_path.relative_to(root_path)
             dir_info = {
                 'path': str(rel_path) if str(rel_path) != '.' else '(root)',
-                'file_count': len(significant_files),
-                'file_types': sorted(set(Path(f).suffix for f in significant_files))
+                'file_count': len(significant_suffixes),
+                'file_types': sorted(set(significant_suffixes))
             }
             
             if has_claude_md:
@@ -0,0 +1,62 @@
+import os
+
+import pytest
+import auto_update
+
+
+@pytest.fixture
+def repo(git_repo, commit):
+    """A git repository with a committed source directory"""
+    commit(git_repo, "src/app.py", "import os\n")
+    commit(git_repo, "src/app.py", "import sys\n")
+    return git_repo
+
+
+def test_recent_changes_summary(repo):
+    """Commits in the window are summarized per status"""
+    changes = auto_update.get_recent_changes(repo / "src")
+    assert changes["summary"] == {"added": 1, "modified": 1, "deleted": 0}
+    assert changes["details"]["added"] == ["src/app.py"]
+
+
+def test_cache_follows_head(repo, commit, worktree_status):
+    """The summary is cached in the git dir and replaced when HEAD moves"""
+    first = auto_update.get_recent_changes(repo / "src")
+    assert auto_update.get_recent_changes(repo / "src") == first
+    cached = os.listdir(repo / ".git" / "ccmp-cache")
+    assert len(cached) == 1 and cached[0].startswith("auto_update_")
+
+    commit(repo, "src/util.py", "import re\n")
+    second = auto_update.get_recent_changes(repo / "src")
+    assert second["summary"]["added"] == 2
+    assert os.listdir(repo / ".git" / "ccmp-cache") == cached
+    assert worktree_status(repo) == ""
+
+
+def test_recent_changes_outside_git(tmp_path):
+    """Outside a repository the summary is empty and nothing is written"""
+    changes = auto_update.get_recent_changes(tmp_path)
+    assert changes["summary"] == {}
+    assert os.listdir(tmp_path) == []
+
+
+def _run_main(monkeypatch, capsys, directory):
+    monkeypatch.setattr("sys.argv", ["auto_update.py", str(directory), "--analyze-only"])
+    with pytest.raises(SystemExit):
+        auto_update.main()
+    return capsys.readouterr().out
+
+
+def test_patterns_analyzed_outside_git(tmp_path, monkeypatch, capsys):
+    """Without git history the source scan still runs"""
+    (tmp_path / "app.py").write_text("import flask\n")
+    report = _run_main(monkeypatch, capsys, tmp_path)
+    assert "New framework detected: Flask" in report
+
+
+def test_patterns_skipped_without_recent_changes(repo, monkeypatch, capsys):
+    """With git history and no changes in the window the scan is skipped"""
+    (repo / "quiet").mkdir()
+    (repo / "quiet" / "app.py").write_text("import flask\n")
+    report = _run_main(monkeypatch, capsys, repo / "quiet")
+    assert "Flask" not in report
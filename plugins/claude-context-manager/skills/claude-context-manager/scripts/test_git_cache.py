@@ -0,0 +1,39 @@
+import os
+import time
+
+import git_cache
+
+
+def test_entries_live_in_git_dir(git_repo, git, commit, worktree_status):
+    """Entries are keyed on HEAD and written inside the git dir, even from a subdirectory"""
+    commit(git_repo, "src/app.py", "x = 1\n")
+    head, cache_dir = git_cache.git_state(git_repo / "src")
+    assert head == git(git_repo, "rev-parse", "HEAD").strip()
+
+    git_cache.store(cache_dir, "demo", "abc", {"head": head}, {"n": 1}, max_age=60)
+    assert git_cache.load(cache_dir, "demo", "abc", {"head": head}) == {"n": 1}
+    assert git_cache.load(cache_dir, "demo", "abc", {"head": "0" * 40}) is None
+    assert os.listdir(git_repo / ".git" / "ccmp-cache") == ["demo_abc.json"]
+    assert worktree_status(git_repo) == ""
+
+
+def test_store_prunes_old_entries_of_same_kind(git_repo, commit):
+    """Only entries of the stored kind older than max_age are removed"""
+    commit(git_repo, "app.py", "x = 1\n")
+    head, cache_dir = git_cache.git_state(git_repo)
+    cache_dir.mkdir()
+    expired = time.time() - 120
+    for name in ("demo_old.json", "other_old.json"):
+        (cache_dir / name).write_text("{}")
+        os.utime(cache_dir / name, (expired, expired))
+
+    git_cache.store(cache_dir, "demo", "new", {"head": head}, [], max_age=60)
+    assert sorted(os.listdir(cache_dir)) == ["demo_new.json", "other_old.json"]
+
+
+def test_no_state_without_commits(git_repo, tmp_path):
+    """Outside a repository or before the first commit there is nothing to key on"""
+    outside = tmp_path / "outside"
+    outside.mkdir()
+    assert git_cache.git_state(outside) is None
+    assert git_cache.git_state(git_repo) is None
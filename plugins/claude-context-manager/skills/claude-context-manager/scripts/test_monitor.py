@@ -0,0 +1,30 @@
+import os
+
+import pytest
+import monitor
+
+
+@pytest.fixture
+def repo(git_repo, commit):
+    """A git repository with a documented src directory"""
+    commit(git_repo, "src/claude.md", "# src\n", days_ago=10)
+    return git_repo
+
+
+def _commits_since_update(repo):
+    result = monitor.monitor_repository(repo)
+    (analysis,) = [a for group in result["files"].values() for a in group]
+    return analysis["commits_since_update"]
+
+
+def test_cache_replaced_when_head_moves(repo, commit, worktree_status):
+    """Each monitored root keeps one cache entry in the git dir that follows HEAD"""
+    before = _commits_since_update(repo)
+    assert _commits_since_update(repo) == before
+    entries = os.listdir(repo / ".git" / "ccmp-cache")
+    assert len(entries) == 1
+
+    commit(repo, "src/app.py", "print('hi')\n", days_ago=1)
+    assert _commits_since_update(repo) == before + 1
+    assert os.listdir(repo / ".git" / "ccmp-cache") == entries
+    assert worktree_status(repo) == ""
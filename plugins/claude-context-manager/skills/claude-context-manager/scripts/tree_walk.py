@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+Directory Tree Walking
+
+Shared by the claude.md scripts to walk a repository while pruning
+ignored directories before they are listed.
+"""
+
+import os
+from typing import Callable, Iterator, List, Tuple
+
+# Directories skipped along with every hidden (dot) directory
+IGNORE_DIRS = frozenset({'node_modules', '__pycache__', 'venv', 'env', 'dist', 'build'})
+
+
+def is_ignored_dir(name: str) -> bool:
+    """Whether a directory name is hidden or commonly ignored."""
+    return name[0] == '.' or name in IGNORE_DIRS
+
+
+def iter_tree(root: str, prune: Callable[[str], bool]) -> Iterator[Tuple[str, List[os.DirEntry]]]:
+    """Yield (dirpath, file entries) for each directory, top-down like os.walk.
+    
+    Directories whose name satisfies prune are never listed. The DirEntry
+    objects keep the type information from the directory listing.
+    """
+    try:
+        with os.scandir(root) as it:
+            entries = list(it)
+    except OSError:
+        return
+    
+    files = []
+    subdirs = []
+    for entry in entries:
+        try:
+            is_dir = entry.is_dir()
+        except OSError:
+            is_dir = False
+        if not is_dir:
+            files.append(entry)
+        # Like os.walk, symlinked directories are not descended into
+        elif not prune(entry.name) and not entry.is_symlink():
+            subdirs.append(entry.path)
+    
+    yield root, files
+    for subdir in subdirs:
+        yield from iter_tree(subdir, prune)
@@ -16,11 +16,15 @@ Examples:
 
 import os
 import sys
+import mmap
 import argparse
+from collections import defaultdict
 from pathlib import Path
-from typing import List, Dict, Tuple
+from typing import List, Dict, Set, Tuple, Union
 import re
 
+from tree_walk import is_ignored_dir, iter_tree
+
 REQUIRED_SECTIONS = [
     'Overview',
     'Purpose'  # Alternative to Overview
@@ -34,31 +38,111 @@ RECOMMENDED_SECTIONS = [
     'Usage'
 ]
 
+# One scan finds TODO markers, header starts (the same split points as
+# re.split(r'^##?\s+')), and links. Links are matched in a lookahead, so
+# markers inside link text still count.
+_CONTENT_RE = re.compile(
+    rb'(?P<todo>TODO|FIXME|XXX)'
+    rb'|(?P<header>^##?\s+)'
+    rb'|(?=\[(?P<link_text>[^\]]+)\]\((?P<link_url>[^\)]+)\))',
+    re.IGNORECASE | re.MULTILINE
+)
+
+# Known section name at the start of a header's text; a header counts if it
+# starts with the section name
+_SECTION_NAME_RE = re.compile(
+    b'|'.join(re.escape(section.encode()) for section in REQUIRED_SECTIONS + RECOMMENDED_SECTIONS),
+    re.IGNORECASE
+)
+_REQUIRED_KEYS = {section.lower().encode() for section in REQUIRED_SECTIONS}
+
+# Files larger than this are memory-mapped instead of read into memory
+MMAP_THRESHOLD = 64 * 1024
+
+# A line of a section with content: not blank and not an HTML comment
+_CONTENT_LINE_RE = re.compile(rb'^[ \t\r\f\v]*(?!<!--)\S', re.MULTILINE)
+
+_NON_SPACE_RE = re.compile(rb'\S')
+_SPACE_BYTES = b' \t\n\r\f\v'
+
 
 def find_claude_md_files(root_path: Path) -> List[Path]:
     """Find all claude.md files in the directory tree."""
     claude_md_files = []
     
-    for dirpath, dirnames, filenames in os.walk(root_path):
-        # Skip common ignored directories
-        dirnames[:] = [d for d in dirnames if not d.startswith('.') and d not in {
-            'node_modules', '__pycache__', 'venv', 'env', 'dist', 'build'
-        }]
-        
-        if 'claude.md' in filenames:
+    # Skip common ignored directories
+    for dirpath, files in iter_tree(os.fspath(root_path), is_ignored_dir):
+        if any(entry.name == 'claude.md' for entry in files):
             claude_md_files.append(Path(dirpath) / 'claude.md')
     
     return claude_md_files
 
 
+def _strip_bounds(content: Union[bytes, mmap.mmap]) -> Tuple[int, int]:
+    """The span of content that bytes.strip() would keep, without copying it."""
+    first = _NON_SPACE_RE.search(content)
+    if not first:
+        return 0, 0
+    end = len(content)
+    while content[end - 1] in _SPACE_BYTES:
+        end -= 1
+    return first.start(), end
+
+
+def _count_lines_and_words(content: Union[bytes, mmap.mmap]) -> Tuple[int, int]:
+    """Line and word counts of content, a bounded chunk at a time."""
+    line_count = 1
+    word_count = 0
+    in_word = False
+    for pos in range(0, len(content), MMAP_THRESHOLD):
+        chunk = content[pos:pos + MMAP_THRESHOLD]
+        line_count += chunk.count(b'\n')
+        word_count += len(chunk.split())
+        # A word running across the chunk boundary was counted twice
+        if in_word and chunk[0] not in _SPACE_BYTES:
+            word_count -= 1
+        in_word = chunk[-1] not in _SPACE_BYTES
+    return line_count, word_count
+
+
+def _missing_targets(targets: List[Path]) -> Set[Path]:
+    """The targets that do not exist, as Path.exists() would judge them.
+    
+    Several targets in one directory are looked up in a single listing of
+    it; a name the listing can't settle (absent, which a case-insensitive
+    filesystem may still match, or a symlink) is checked with exists().
+    """
+    names_by_dir = defaultdict(set)
+    for target in targets:
+        names_by_dir[target.parent].add(target.name)
+    
+    missing = set()
+    for directory, names in names_by_dir.items():
+        listed = {}
+        if len(names) > 1:
+            try:
+                with os.scandir(directory) as it:
+                    listed = {entry.name: entry for entry in it}
+            except OSError:
+                pass
+        for name in names:
+            entry = listed.get(name)
+            if entry is None or entry.is_symlink():
+                if not (directory / name).exists():
+                    missing.add(directory / name)
+    return missing
+
+
 def validate_claude_md(file_path: Path, strict: bool = False) -> Dict:
     """Validate a single claude.md file."""
-    issues = []
-    warnings = []
-    
+    # Validation only looks for ASCII markers, so the content stays undecoded;
+    # large files are scanned in place through a memory map
     try:
-        with open(file_path, 'r') as f:
-            content = f.read()
+        with open(file_path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size > MMAP_THRESHOLD:
+                content = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            else:
+                content = f.read()
     except Exception as e:
         return {
             'valid': False,
@@ -67,14 +151,52 @@ def validate_claude_md(file_path: Path, strict: bool = False) -> Dict:
             'stats': {}
         }
     
-    lines = content.split('\n')
+    try:
+        return _validate_content(file_path, content, strict)
+    finally:
+        if isinstance(content, mmap.mmap):
+            content.close()
+
+
+def _validate_content(file_path: Path, content: Union[bytes, mmap.mmap], strict: bool) -> Dict:
+    """Validate a claude.md file's raw content."""
+    issues = []
+    warnings = []
     
-    # Check for empty or very short files
-    if len(content.strip()) < 50:
+    # Check for empty or very short files, counting characters as text mode
+    # would (CRLF as one); a character takes at most 4 bytes, so only a
+    # length in between needs decoding
+    start, end = _strip_bounds(content)
+    if end - start < 50 or (
+        end - start < 200
+        and len(content[start:end].decode('utf-8', 'replace')) - content[start:end].count(b'\r\n') < 50
+    ):
         issues.append("File is too short (less than 50 characters)")
     
+    # Single pass collecting markers, known section headers, header spans
+    # and links
+    todo_count = 0
+    headers = set()
+    header_spans = []
+    links = []
+    link_end = 0
+    for m in _CONTENT_RE.finditer(content):
+        kind = m.lastgroup
+        if kind == 'todo':
+            todo_count += 1
+        elif kind == 'header':
+            header_spans.append((m.start(), m.end()))
+            # Section names only count on the header's own line
+            if b'\n' not in m.group('header'):
+                name = _SECTION_NAME_RE.match(content, m.end())
+                if name:
+                    headers.add(name.group(0).lower())
+        elif m.start() >= link_end:
+            # Links don't overlap, as with re.findall
+            links.append((m.group('link_text'), m.group('link_url')))
+            link_end = m.end('link_url') + 1
+    
     # Check for TODO markers
-    todo_count = len(re.findall(r'TODO|FIXME|XXX', content, re.IGNORECASE))
     if todo_count > 0:
         if strict:
             issues.append(f"Found {todo_count} TODO/FIXME markers")
@@ -82,49 +204,58 @@ def validate_claude_md(file_path: Path, strict: bool = False) -> Dict:
             warnings.append(f"Found {todo_count} TODO/FIXME markers")
     
     # Check for required sections
-    has_overview = any(re.search(r'^##?\s+(Overview|Purpose)', line, re.IGNORECASE) for line in lines)
+    has_overview = bool(headers & _REQUIRED_KEYS)
     if not has_overview:
         issues.append("Missing required section: Overview or Purpose")
     
     # Check for recommended sections
-    found_sections = []
-    for section in RECOMMENDED_SECTIONS:
-        if any(re.search(rf'^##?\s+{section}', line, re.IGNORECASE) for line in lines):
-            found_sections.append(section)
+    found_sections = [section for section in RECOMMENDED_SECTIONS if section.lower().encode() in headers]
     
     missing_recommended = set(RECOMMENDED_SECTIONS) - set(found_sections)
     if missing_recommended and strict:
         warnings.append(f"Missing recommended sections: {', '.join(missing_recommended)}")
     
     # Check for placeholder text
-    if '<!-- TODO' in content or 'Description' in content and 'TODO' in content:
+    if content.find(b'<!-- TODO') != -1 or content.find(b'Description') != -1 and content.find(b'TODO') != -1:
         if strict:
             issues.append("Contains placeholder TODO comments that need completion")
         else:
             warnings.append("Contains placeholder TODO comments")
     
     # Check for minimal content in sections
-    sections = re.split(r'^##?\s+', content, flags=re.MULTILINE)[1:]  # Split by headers
-    for section in sections:
-        lines_in_section = [l.strip() for l in section.split('\n')[1:] if l.strip() and not l.strip().startswith('<!--')]
-        if len(lines_in_section) < 2:
-            section_name = section.split('\n')[0]
+    # Each section runs from the end of its header to the next header; its
+    # first line is the header's text, and the lines after it need content
+    for (_, start), (next_start, _) in zip(header_spans, header_spans[1:] + [(len(content), None)]):
+        content_lines = 0
+        first_line_end = content.find(b'\n', start, next_start)
+        if first_line_end == -1:
+            first_line_end = next_start
+        else:
+            for _ in _CONTENT_LINE_RE.finditer(content, first_line_end + 1, next_start):
+                content_lines += 1
+                if content_lines == 2:
+                    break
+        if content_lines < 2:
+            section_name = content[start:first_line_end].rstrip(b'\r').decode('utf-8', 'replace')
             warnings.append(f"Section '{section_name}' has minimal content")
     
     # Check for broken links (basic check)
-    broken_link_pattern = r'\[([^\]]+)\]\(([^\)]+)\)'
-    links = re.findall(broken_link_pattern, content)
-    for link_text, link_url in links:
-        if link_url.startswith('./') or link_url.startswith('../'):
-            # Check if relative path exists
-            target_path = file_path.parent / link_url
-            if not target_path.exists():
-                warnings.append(f"Potentially broken relative link: {link_url}")
+    relative_urls = [
+        link_url.decode('utf-8', 'replace')
+        for _, link_url in links if link_url.startswith((b'./', b'../'))
+    ]
+    missing = _missing_targets([file_path.parent / link_url for link_url in relative_urls])
+    for link_url in relative_urls:
+        # Check if relative path exists
+        if file_path.parent / link_url in missing:
+            warnings.append(f"Potentially broken relative link: {link_url}")
+    
+    line_count, word_count = _count_lines_and_words(content)
     
     # Check age (if git is available)
     stats = {
-        'line_count': len(lines),
-        'word_count': len(content.split()),
+        'line_count': line_count,
+        'word_count': word_count,
         'todo_count': todo_count,
         'sections_found': len(found_sections)
     }
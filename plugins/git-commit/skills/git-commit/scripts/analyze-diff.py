@@ -13,25 +13,26 @@ import sys
 import re
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional
-from collections import defaultdict
+from collections import Counter
 
 
 class DiffAnalyzer:
     """Analyze git diffs to suggest commit messages."""
     
-    # Map file patterns to scopes
-    SCOPE_PATTERNS = {
-        r'.*/(auth|login|oauth)': 'auth',
-        r'.*/(api|endpoints|routes)': 'api',
-        r'.*/database|migrations': 'database',
-        r'.*/tests?/': 'test',
-        r'.*/(ui|components|views)': 'ui',
-        r'.*/docs?/': 'docs',
-        r'.*/(config|settings)': 'config',
-        r'.*\.github/': 'ci',
-        r'Dockerfile|docker-compose': 'docker',
-        r'.*/(deploy|infra|terraform)': 'ops',
-    }
+    # Map path substrings to scopes; the first scope with a substring found
+    # in a path wins
+    SCOPE_SUBSTRINGS = [
+        ('auth', ('/auth', '/login', '/oauth')),
+        ('api', ('/api', '/endpoints', '/routes')),
+        ('database', ('/database', 'migrations')),
+        ('test', ('/test/', '/tests/')),
+        ('ui', ('/ui', '/components', '/views')),
+        ('docs', ('/doc/', '/docs/')),
+        ('config', ('/config', '/settings')),
+        ('ci', ('.github/',)),
+        ('docker', ('Dockerfile', 'docker-compose')),
+        ('ops', ('/deploy', '/infra', '/terraform')),
+    ]
     
     # Keywords in diff that suggest commit types
     TYPE_KEYWORDS = {
@@ -66,6 +67,33 @@ class DiffAnalyzer:
         ],
     }
     
+    # An added line of a diff ('+' but not a '+++' file header), found by the
+    # newline before it; a literal start is much faster to scan for than '^'
+    ADDED_LINE_RE = re.compile(r'\n(\+(?!\+\+)[^\n]*)')
+    
+    # Per keyword, a regex matching once per line that contains it: the first
+    # occurrence through to the end of the line
+    KEYWORD_LINE_PATTERNS = {
+        commit_type: [re.compile(f'{re.escape(keyword)}.*') for keyword in keywords]
+        for commit_type, keywords in TYPE_KEYWORDS.items()
+    }
+    
+    # Entity names introduced by added lines
+    ADDED_PATTERNS = [
+        re.compile(r'\+.*def (\w+)'),  # Python functions
+        re.compile(r'\+.*function (\w+)'),  # JS functions
+        re.compile(r'\+.*class (\w+)'),  # Classes
+        re.compile(r'\+.*const (\w+)'),  # Constants
+    ]
+    
+    # Diff patterns suggesting a breaking change, checked in order
+    BREAKING_INDICATORS = [
+        (re.compile(r'\-.*public ', re.IGNORECASE), 'removed public API'),
+        (re.compile(r'\-.*export ', re.IGNORECASE), 'removed exports'),
+        (re.compile(r'BREAKING CHANGE', re.IGNORECASE), 'explicitly marked'),
+        (re.compile(r'\-.*@deprecated', re.IGNORECASE), 'removed deprecated feature'),
+    ]
+    
     def __init__(self):
         self.git_root = self._get_git_root()
     
@@ -98,28 +126,31 @@ class DiffAnalyzer:
     def get_staged_changes(self) -> Dict[str, any]:
         """Get information about staged changes."""
         
-        # Get list of changed files
-        files_output = self._run_git(['diff', '--staged', '--name-status'])
+        # Get list of changed files; -z gives NUL-separated fields with
+        # paths unquoted
+        files_output = self._run_git(['diff', '--staged', '--name-status', '-z'])
         if not files_output:
             return None
         
         files = []
-        for line in files_output.strip().split('\n'):
-            if not line:
-                continue
-            parts = line.split('\t', 1)
-            status = parts[0]
-            filepath = parts[1] if len(parts) > 1 else ''
+        fields = files_output.split('\0')
+        i = 0
+        while i < len(fields) - 1:
+            status = fields[i]
+            # Renames and copies list the old and new path
+            path_count = 2 if status[:1] in ('R', 'C') else 1
+            filepath = '\t'.join(fields[i + 1:i + 1 + path_count])
+            i += 1 + path_count
             files.append({
                 'path': filepath,
                 'status': status,  # A=added, M=modified, D=deleted
             })
         
-        # Get the actual diff
-        diff = self._run_git(['diff', '--staged'])
-        
-        # Get stats
-        stats_output = self._run_git(['diff', '--staged', '--stat'])
+        # Get stats and the actual diff in one call; a blank line separates them
+        output = self._run_git(['diff', '--staged', '--no-color', '--no-ext-diff', '--stat', '--patch'])
+        stats_output, separator, diff = output.partition('\n\n')
+        if separator:
+            stats_output += '\n'
         
         return {
             'files': files,
@@ -127,16 +158,23 @@ class DiffAnalyzer:
             'stats': stats_output,
         }
     
+    def _match_scope(self, path: str) -> Optional[str]:
+        """Scope of the first SCOPE_SUBSTRINGS entry found in path."""
+        for scope, substrings in self.SCOPE_SUBSTRINGS:
+            for substring in substrings:
+                if substring in path:
+                    return scope
+        return None
+    
     def infer_scope(self, files: List[Dict]) -> Optional[str]:
         """Infer scope from changed file paths."""
         
         scopes = []
         for file in files:
             path = file['path'].lower()
-            for pattern, scope in self.SCOPE_PATTERNS.items():
-                if re.search(pattern, path):
-                    scopes.append(scope)
-                    break
+            scope = self._match_scope(path)
+            if scope:
+                scopes.append(scope)
         
         if not scopes:
             # Try to extract from path
@@ -175,21 +213,15 @@ class DiffAnalyzer:
         if only_docs:
             return 'docs', 0.9
         
-        # Analyze diff content
-        diff_lower = diff.lower()
-        type_scores = defaultdict(int)
-        
-        for commit_type, keywords in self.TYPE_KEYWORDS.items():
-            for keyword in keywords:
-                # Count occurrences in added lines
-                added_lines = [
-                    line for line in diff.split('\n') 
-                    if line.startswith('+') and not line.startswith('+++')
-                ]
-                
-                for line in added_lines:
-                    if keyword in line.lower():
-                        type_scores[commit_type] += 1
+        # Analyze diff content: each keyword scores once per added line
+        # containing it
+        added_lower = '\n'.join(self.ADDED_LINE_RE.findall('\n' + diff)).lower()
+        type_scores = Counter()
+        
+        for commit_type, patterns in self.KEYWORD_LINE_PATTERNS.items():
+            score = sum(len(pattern.findall(added_lower)) for pattern in patterns)
+            if score:
+                type_scores[commit_type] += score
         
         # Adjust scores based on file status
         if has_new_files:
@@ -202,10 +234,11 @@ class DiffAnalyzer:
         if not type_scores:
             return 'chore', 0.3
         
-        best_type = max(type_scores.items(), key=lambda x: x[1])
-        confidence = min(best_type[1] / 10, 1.0)  # Normalize to 0-1
+        # Ties go to the type scored first, as with max()
+        best_type, best_score = type_scores.most_common(1)[0]
+        confidence = min(best_score / 10, 1.0)  # Normalize to 0-1
         
-        return best_type[0], confidence
+        return best_type, confidence
     
     def generate_description(self, 
                            files: List[Dict], 
@@ -213,42 +246,39 @@ class DiffAnalyzer:
                            commit_type: str) -> str:
         """Generate a description based on changes."""
         
-        # Extract function/class names from diff
-        added_patterns = [
-            r'\+.*def (\w+)',  # Python functions
-            r'\+.*function (\w+)',  # JS functions
-            r'\+.*class (\w+)',  # Classes
-            r'\+.*const (\w+)',  # Constants
-        ]
-        
-        entities = []
-        for pattern in added_patterns:
-            matches = re.findall(pattern, diff)
-            entities.extend(matches[:3])  # Limit to first 3
+        # Extract a function/class name from diff; patterns are tried in
+        # order, so only the first match of the first matching one is needed
+        entity = None
+        for pattern in self.ADDED_PATTERNS:
+            match = pattern.search(diff)
+            if match:
+                entity = match.group(1)
+                break
         
         # Generate description based on type
-        if commit_type == 'feat' and entities:
-            entity = entities[0]
+        if commit_type == 'feat' and entity:
             return f"add {entity}"
         
         elif commit_type == 'fix':
             # Look for bug-related keywords in diff
-            if 'null' in diff.lower() and 'check' in diff.lower():
+            diff_lower = diff.lower()
+            if 'null' in diff_lower and 'check' in diff_lower:
                 return "prevent null pointer exception"
-            elif 'error' in diff.lower():
+            elif 'error' in diff_lower:
                 return "fix error handling"
             else:
                 return "fix bug"
         
         elif commit_type == 'refactor':
-            if entities:
-                return f"extract {entities[0]} logic"
+            if entity:
+                return f"extract {entity} logic"
             return "restructure code"
         
         elif commit_type == 'perf':
-            if 'cache' in diff.lower():
+            diff_lower = diff.lower()
+            if 'cache' in diff_lower:
                 return "add caching"
-            elif 'index' in diff.lower():
+            elif 'index' in diff_lower:
                 return "optimize database queries"
             return "improve performance"
         
@@ -256,8 +286,8 @@ class DiffAnalyzer:
             return "update documentation"
         
         elif commit_type == 'test':
-            if entities:
-                return f"add tests for {entities[0]}"
+            if entity:
+                return f"add tests for {entity}"
             return "add tests"
         
         # Default descriptions
@@ -271,15 +301,8 @@ class DiffAnalyzer:
     def is_breaking_change(self, diff: str) -> Tuple[bool, Optional[str]]:
         """Detect if this might be a breaking change."""
         
-        breaking_indicators = [
-            (r'\-.*public ', 'removed public API'),
-            (r'\-.*export ', 'removed exports'),
-            (r'BREAKING CHANGE', 'explicitly marked'),
-            (r'\-.*@deprecated', 'removed deprecated feature'),
-        ]
-        
-        for pattern, reason in breaking_indicators:
-            if re.search(pattern, diff, re.IGNORECASE):
+        for pattern, reason in self.BREAKING_INDICATORS:
+            if pattern.search(diff):
                 return True, reason
         
         return False, None
@@ -8,6 +8,7 @@ Usage:
     python changelog.py --version 2.0.0    # Add version header
 """
 
+import io
 import subprocess
 import sys
 import re
@@ -16,8 +17,21 @@ from collections import defaultdict
 from datetime import datetime
 
 
+# Characters of git log output read at a time
+LOG_READ_SIZE = 64 * 1024
+
+
 class Commit:
     """Parsed commit."""
+    
+    __slots__ = ('hash', 'message', 'type', 'scope', 'breaking', 'description', 'breaking_details')
+    
+    # Match: type(scope)!: description
+    HEADER_RE = re.compile(r'^(?P<type>\w+)(?:\((?P<scope>[^)]+)\))?(?P<breaking>!)?:\s*(?P<desc>.+)$')
+    
+    # A line of the message starting with the breaking change footer
+    BREAKING_LINE_RE = re.compile(r'^BREAKING CHANGE:.*', re.MULTILINE)
+    
     def __init__(self, hash: str, message: str):
         self.hash = hash
         self.message = message
@@ -25,16 +39,15 @@ class Commit:
         self.scope = None
         self.breaking = False
         self.description = None
+        self.breaking_details = []
         
         self._parse()
     
     def _parse(self):
         """Parse conventional commit message."""
-        header = self.message.split('\n')[0]
+        header = self.message.partition('\n')[0]
         
-        # Match: type(scope)!: description
-        pattern = r'^(?P<type>\w+)(?:\((?P<scope>[^)]+)\))?(?P<breaking>!)?:\s*(?P<desc>.+)$'
-        match = re.match(pattern, header)
+        match = self.HEADER_RE.match(header)
         
         if match:
             self.type = match.group('type')
@@ -42,9 +55,14 @@ class Commit:
             self.breaking = bool(match.group('breaking'))
             self.description = match.group('desc')
         
-        # Check for BREAKING CHANGE in body
+        # Check for BREAKING CHANGE in body, keeping the details given on
+        # lines starting with it
         if 'BREAKING CHANGE:' in self.message:
             self.breaking = True
+            for match in self.BREAKING_LINE_RE.finditer(self.message):
+                detail = match.group(0).replace('BREAKING CHANGE:', '').strip()
+                if detail:
+                    self.breaking_details.append(detail)
     
     @property
     def is_valid(self):
@@ -78,33 +96,32 @@ class ChangelogGenerator:
     
     def get_commits(self, from_ref: Optional[str] = None) -> List[Commit]:
         """Get commits from git log."""
-        cmd = ['git', 'log', '--format=%H%n%B%n---END---']
+        # Each commit is "<hash>\x1f<message>" with -z ending it in a NUL, so
+        # message bodies can't be mistaken for a separator
+        cmd = ['git', 'log', '-z', '--format=%H%x1f%B']
         
         if from_ref:
             cmd.insert(2, f'{from_ref}..HEAD')
         
-        try:
-            result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-        except subprocess.CalledProcessError:
-            return []
-        
         commits = []
-        lines = result.stdout.split('\n')
-        
-        current_hash = None
-        current_message = []
-        
-        for line in lines:
-            if not current_hash:
-                current_hash = line.strip()
-            elif line == '---END---':
-                if current_hash and current_message:
-                    message = '\n'.join(current_message)
-                    commits.append(Commit(current_hash, message))
-                current_hash = None
-                current_message = []
-            else:
-                current_message.append(line)
+        
+        def add_commit(record: str):
+            commit_hash, separator, message = record.partition('\x1f')
+            if separator:
+                commits.append(Commit(commit_hash.strip(), message))
+        
+        # Parse the log as git writes it rather than buffering all of it
+        with subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True) as proc:
+            pending = ''
+            for chunk in iter(lambda: proc.stdout.read(LOG_READ_SIZE), ''):
+                records = (pending + chunk).split('\0')
+                pending = records.pop()
+                for record in records:
+                    add_commit(record)
+            add_commit(pending)
+        
+        if proc.returncode != 0:
+            return []
         
         return commits
     
@@ -129,17 +146,15 @@ class ChangelogGenerator:
     
     def format_commit(self, commit: Commit) -> str:
         """Format a single commit line."""
-        parts = []
-        
         if commit.scope:
-            parts.append(f"**{commit.scope}**:")
-        
-        parts.append(commit.description)
+            line = f"- **{commit.scope}**: {commit.description}"
+        else:
+            line = f"- {commit.description}"
         
         if self.include_hash:
-            parts.append(f"([`{commit.hash[:7]}`])")
+            line += f" ([`{commit.hash[:7]}`])"
         
-        return '- ' + ' '.join(parts)
+        return line
     
     def generate(
         self,
@@ -154,29 +169,26 @@ class ChangelogGenerator:
             return "No commits found."
         
         grouped = self.group_commits(commits)
-        lines = []
+        # Sections are separated by a blank line
+        buf = io.StringIO()
         
         # Version header
         if version:
             header = f"## [{version}]"
             if date:
                 header += f" - {date}"
-            lines.append(header)
-            lines.append("")
+            buf.write(f"{header}\n")
         
         # Breaking changes first
         if grouped['breaking']:
-            lines.append("### ⚠️  BREAKING CHANGES")
-            lines.append("")
+            if buf.tell():
+                buf.write("\n")
+            buf.write("### ⚠️  BREAKING CHANGES\n\n")
             for commit in grouped['breaking']:
-                lines.append(self.format_commit(commit))
+                buf.write(f"{self.format_commit(commit)}\n")
                 # Add BREAKING CHANGE description if available
-                for line in commit.message.split('\n'):
-                    if line.startswith('BREAKING CHANGE:'):
-                        detail = line.replace('BREAKING CHANGE:', '').strip()
-                        if detail:
-                            lines.append(f"  - {detail}")
-            lines.append("")
+                for detail in commit.breaking_details:
+                    buf.write(f"  - {detail}\n")
         
         # Group by type
         for commit_type in self.TYPE_ORDER:
@@ -187,15 +199,14 @@ class ChangelogGenerator:
             if not type_commits:
                 continue
             
-            lines.append(self.TYPE_HEADERS[commit_type])
-            lines.append("")
+            if buf.tell():
+                buf.write("\n")
+            buf.write(f"{self.TYPE_HEADERS[commit_type]}\n\n")
             
             for commit in type_commits:
-                lines.append(self.format_commit(commit))
-            
-            lines.append("")
+                buf.write(f"{self.format_commit(commit)}\n")
         
-        return '\n'.join(lines)
+        return buf.getvalue()
 
 
 def get_latest_tag() -> Optional[str]:
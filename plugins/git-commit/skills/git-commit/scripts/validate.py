@@ -11,6 +11,31 @@ Usage:
 import sys
 import re
 
+TYPES = ('feat', 'fix', 'refactor', 'perf', 'style', 'test', 'docs', 'build', 'ops', 'chore')
+
+# What a standard header can start with: a type, then its scope, breaking
+# marker or separator
+TYPE_PREFIXES = tuple(t + c for t in TYPES for c in ('(', '!', ':'))
+
+# Standard format
+HEADER_RE = re.compile(
+    rf'^({"|".join(TYPES)})'
+    r'(\([a-z0-9-]+\))?'
+    r'!?'
+    r': '
+    r'.{1,100}$'
+)
+
+# A header passing every check except description casing, in one match:
+# the standard format with a description not ending in a period
+VALID_HEADER_RE = re.compile(
+    rf'^({"|".join(TYPES)})'
+    r'(\([a-z0-9-]+\))?'
+    r'!?'
+    r': '
+    r'(?P<desc>.{0,99}[^.\n])$'
+)
+
 
 def validate_commit(message):
     """Validate commit message, return (is_valid, error_message)."""
@@ -23,16 +48,15 @@ def validate_commit(message):
         header == 'chore: init'):
         return True, None
     
-    # Standard format
-    pattern = (
-        r'^(feat|fix|refactor|perf|style|test|docs|build|ops|chore)'
-        r'(\([a-z0-9-]+\))?'
-        r'!?'
-        r': '
-        r'.{1,100}$'
-    )
+    # Fast path for valid headers; failures are diagnosed step by step below
+    has_type_prefix = header.startswith(TYPE_PREFIXES)
+    if has_type_prefix:
+        match = VALID_HEADER_RE.match(header)
+        if match and not match.group('desc')[0].isupper():
+            return True, None
     
-    if not re.match(pattern, header):
+    # Standard format; without a type prefix the regex can't match
+    if not has_type_prefix or not HEADER_RE.match(header):
         return False, (
             f"Invalid format: {header}\n\n"
             f"Expected: <type>(<scope>): <description>\n"
@@ -16,6 +16,8 @@ from typing import Optional, Tuple
 
 class Version:
     """Semantic version."""
+    __slots__ = ('major', 'minor', 'patch')
+    
     def __init__(self, major: int, minor: int, patch: int):
         self.major = major
         self.minor = minor
@@ -51,11 +53,17 @@ class Version:
 class CommitAnalyzer:
     """Analyze commits for versioning."""
     
+    # Either a breaking change (the first '!' comes before the first ':') or
+    # the commit type of a type(scope): header
+    CLASSIFY_RE = re.compile(r'^(?:(?P<breaking>[^:!]*![^:]*:)|(?P<type>\w+)(?:\([^)]+\))?:)')
+    
     def __init__(self):
         self.breaking_commits = []
         self.feature_commits = []
         self.fix_commits = []
         self.other_commits = []
+        # Commit type -> list its commits go in; other types go in other_commits
+        self._buckets = {'feat': self.feature_commits, 'fix': self.fix_commits}
     
     def analyze(self, from_ref: Optional[str] = None):
         """Analyze commits since ref."""
@@ -66,41 +74,38 @@ class CommitAnalyzer:
     
     def _get_commits(self, from_ref: Optional[str]) -> list:
         """Get commit messages."""
-        cmd = ['git', 'log', '--format=%s']
+        # Subjects are NUL-terminated with -z
+        cmd = ['git', 'log', '-z', '--format=%s']
         
         if from_ref:
             cmd.insert(2, f'{from_ref}..HEAD')
         
         try:
             result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-            return [line.strip() for line in result.stdout.split('\n') if line.strip()]
+            return [subject for line in result.stdout.split('\0') if (subject := line.strip())]
         except subprocess.CalledProcessError:
             return []
     
     def _classify_commit(self, message: str):
         """Classify a commit message."""
-        # Check for breaking change
-        if '!' in message and ':' in message:
-            if message.index('!') < message.index(':'):
-                self.breaking_commits.append(message)
-                return
+        # Without a '!' it can't be breaking, and only feat and fix are
+        # bucketed by type
+        if '!' not in message and not message.startswith(('feat', 'fix')):
+            self.other_commits.append(message)
+            return
         
-        # Parse type
-        pattern = r'^(?P<type>\w+)(?:\([^)]+\))?:\s*'
-        match = re.match(pattern, message)
+        match = self.CLASSIFY_RE.match(message)
         
         if not match:
             self.other_commits.append(message)
             return
         
-        commit_type = match.group('type')
+        # Check for breaking change
+        if match.group('breaking'):
+            self.breaking_commits.append(message)
+            return
         
-        if commit_type == 'feat':
-            self.feature_commits.append(message)
-        elif commit_type == 'fix':
-            self.fix_commits.append(message)
-        else:
-            self.other_commits.append(message)
+        self._buckets.get(match.group('type'), self.other_commits).append(message)
     
     def get_bump_type(self) -> Tuple[str, str]:
         """
@@ -5,9 +5,10 @@ Git Analysis Module
 Analyzes git repository state for project status reports.
 """
 
+import os
 import subprocess
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 
 
 class GitAnalyzer:
@@ -16,52 +17,96 @@ class GitAnalyzer:
     def __init__(self, repo_path: str = "."):
         """Initialize analyzer with repository path"""
         self.repo_path = Path(repo_path)
-
-    def _run_git(self, args: List[str]) -> Optional[str]:
-        """Run git command and return output"""
+        self._cache: Dict[str, Any] = {}
+
+    def _iter_git_lines(self, args: List[str]) -> Iterator[str]:
+        """Run git command on first iteration and yield its output lines"""
+        with subprocess.Popen(
+            ["git"] + args,
+            cwd=self.repo_path,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            bufsize=1
+        ) as proc:
+            for line in proc.stdout:
+                yield line.rstrip("\n")
+
+    def _run_git_porcelain(self) -> Optional[Dict[str, Any]]:
+        """Read branch, sync and working tree state from one git status call"""
         try:
             result = subprocess.run(
-                ["git"] + args,
+                ["git", "status", "--porcelain=v2", "--branch", "-uall", "-z"],
                 cwd=self.repo_path,
                 capture_output=True,
-                text=True,
                 check=True
             )
-            return result.stdout.strip()
         except subprocess.CalledProcessError:
             return None
 
+        status: Dict[str, Any] = {
+            "head": None,
+            "upstream": None,
+            "ab": None,
+            "staged": [],
+            "modified": [],
+            "untracked": []
+        }
+        entries = iter(result.stdout.split(b"\x00"))
+        for entry in entries:
+            kind = entry[:2]
+            if kind == b"# ":
+                key, _, value = entry[2:].decode("utf-8", "replace").partition(" ")
+                if key == "branch.head":
+                    # Match `rev-parse --abbrev-ref HEAD` on a detached HEAD
+                    status["head"] = "HEAD" if value == "(detached)" else value
+                elif key == "branch.upstream":
+                    status["upstream"] = value
+                elif key == "branch.ab":
+                    ahead, behind = value.split(" ")
+                    status["ab"] = (int(ahead), -int(behind))
+            elif kind == b"? ":
+                status["untracked"].append(os.fsdecode(entry[2:]))
+            elif kind in (b"1 ", b"2 ", b"u "):
+                # Ordinary, renamed/copied and unmerged records carry 8, 9
+                # and 10 fields before the path; renames are followed by the
+                # original path as its own entry
+                fields = entry.split(b" ", {b"1 ": 8, b"2 ": 9, b"u ": 10}[kind])
+                path = os.fsdecode(fields[-1])
+                if kind == b"2 ":
+                    next(entries, None)
+                xy = fields[1]
+                if kind == b"u " or xy[:1] != b".":
+                    status["staged"].append(path)
+                if kind == b"u " or xy[1:] != b".":
+                    status["modified"].append(path)
+
+        return status
+
+    def _status(self) -> Optional[Dict[str, Any]]:
+        """Return the cached git status, running it on first use"""
+        if "status" not in self._cache:
+            self._cache["status"] = self._run_git_porcelain()
+        return self._cache["status"]
+
     def get_current_branch(self) -> Optional[str]:
         """Get current git branch name"""
-        return self._run_git(["rev-parse", "--abbrev-ref", "HEAD"])
+        status = self._status()
+        return status["head"] if status else None
 
     def get_uncommitted_changes(self) -> Dict[str, List[str]]:
         """Get uncommitted and untracked files"""
-        # Get staged files
-        staged_output = self._run_git(["diff", "--cached", "--name-only"])
-        staged = staged_output.split("\n") if staged_output else []
-        staged = [f for f in staged if f]  # Filter empty strings
-
-        # Get modified files
-        modified_output = self._run_git(["diff", "--name-only"])
-        modified = modified_output.split("\n") if modified_output else []
-        modified = [f for f in modified if f]  # Filter empty strings
-
-        # Get untracked files
-        untracked_output = self._run_git(["ls-files", "--others", "--exclude-standard"])
-        untracked = untracked_output.split("\n") if untracked_output else []
-        untracked = [f for f in untracked if f]
-
+        status = self._status() or {}
         return {
-            "staged": staged,
-            "modified": modified,
-            "untracked": untracked
+            "staged": list(status.get("staged", [])),
+            "modified": list(status.get("modified", [])),
+            "untracked": list(status.get("untracked", []))
         }
 
     def get_active_branches(self, limit: int = 10) -> List[Dict[str, str]]:
         """Get branches sorted by recent activity"""
         # Get all branches with last commit info
-        output = self._run_git([
+        lines = self._iter_git_lines([
             "for-each-ref",
             "--sort=-committerdate",
             "--format=%(refname:short)|%(committerdate:relative)|%(subject)",
@@ -69,11 +114,8 @@ class GitAnalyzer:
             f"--count={limit}"
         ])
 
-        if not output:
-            return []
-
         branches = []
-        for line in output.split("\n"):
+        for line in lines:
             if not line:
                 continue
             parts = line.split("|", 2)
@@ -88,31 +130,20 @@ class GitAnalyzer:
 
     def get_remote_sync_status(self) -> Dict[str, Any]:
         """Get sync status with remote"""
-        current_branch = self.get_current_branch()
-        if not current_branch:
+        status = self._status()
+        if not status or not status["head"]:
             return {"error": "Not in a git repository"}
 
-        # Get ahead/behind count
-        upstream = self._run_git(["rev-parse", "--abbrev-ref", f"{current_branch}@{{upstream}}"])
-
-        if not upstream:
+        # branch.ab is only reported when the upstream resolves
+        if not status["upstream"] or not status["ab"]:
             return {"status": "no_upstream"}
 
-        # Get ahead/behind counts
-        ahead_behind = self._run_git(["rev-list", "--left-right", "--count", f"{upstream}...HEAD"])
-
-        if ahead_behind:
-            parts = ahead_behind.split("\t")
-            behind = int(parts[0])
-            ahead = int(parts[1])
-
-            return {
-                "upstream": upstream,
-                "ahead": ahead,
-                "behind": behind
-            }
-
-        return {"status": "unknown"}
+        ahead, behind = status["ab"]
+        return {
+            "upstream": status["upstream"],
+            "ahead": ahead,
+            "behind": behind
+        }
 
     def generate_report(self) -> str:
         """Generate git status section of report"""
@@ -6,8 +6,11 @@ Main CLI for generating comprehensive project status reports.
 """
 
 import argparse
+import os
 import sys
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
+from itertools import islice
 from pathlib import Path
 
 from health_check import HealthChecker
@@ -32,17 +35,21 @@ class ReportGenerator:
         if not checkpoints_dir.exists():
             return "**No previous sessions found**"
 
-        # Get most recent checkpoint
-        checkpoints = sorted(checkpoints_dir.glob("*.md"), reverse=True)
-        if not checkpoints:
+        # Get most recent checkpoint (names are timestamps)
+        best = None
+        with os.scandir(checkpoints_dir) as entries:
+            for entry in entries:
+                if entry.name.endswith(".md") and (best is None or entry.name > best.name):
+                    best = entry
+        if best is None:
             return "**No checkpoints found**"
 
-        latest = checkpoints[0]
+        latest = Path(best.path)
 
         # Read first few lines for summary
         try:
-            with open(latest) as f:
-                lines = f.readlines()[:15]
+            with open(latest, errors="replace") as f:
+                lines = list(islice(f, 15))
 
             summary = f"**Last Checkpoint**: {latest.stem}\n\n"
             summary += "".join(lines)
@@ -50,29 +57,44 @@ class ReportGenerator:
         except IOError:
             return "**Error reading checkpoint**"
 
+    @staticmethod
+    def _section_result(future: Future, title: str) -> str:
+        """Return a section's output, or an error note under its title"""
+        try:
+            return future.result()
+        except Exception as e:
+            return f"{title}\n\n**Error generating section**: {e}"
+
     def generate(self) -> str:
         """Generate complete project status report"""
+        # Sections are I/O bound and independent, so gather them in parallel
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            health = executor.submit(self.health_checker.generate_report)
+            git = executor.submit(self.git_analyzer.generate_report)
+            session = executor.submit(
+                lambda: f"## 📖 Recent Session\n\n{self.load_recent_session()}"
+            )
+            work = executor.submit(self.work_scanner.generate_report)
+
         lines = []
         lines.append("# Project Status Report")
         lines.append(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
         lines.append("")
 
         # Priority 1: Health Indicators
-        lines.append(self.health_checker.generate_report())
+        lines.append(self._section_result(health, "## 🏥 Health Indicators"))
         lines.append("")
 
         # Priority 2: Git Status
-        lines.append(self.git_analyzer.generate_report())
+        lines.append(self._section_result(git, "## 📍 Git Status"))
         lines.append("")
 
         # Priority 3: Recent Session
-        lines.append("## 📖 Recent Session")
-        lines.append("")
-        lines.append(self.load_recent_session())
+        lines.append(self._section_result(session, "## 📖 Recent Session"))
         lines.append("")
 
         # Priority 4: Open Work Items
-        lines.append(self.work_scanner.generate_report())
+        lines.append(self._section_result(work, "## 📋 Open Work Items"))
         lines.append("")
 
         # Priority 5: Backlog (placeholder)
@@ -1,4 +1,5 @@
 import pytest
+import subprocess
 from git_analysis import GitAnalyzer
 
 def test_get_current_branch():
@@ -31,3 +32,78 @@ def test_get_active_branches():
         assert "name" in branch
         assert "last_commit" in branch
         assert "last_activity" in branch
+
+@pytest.fixture
+def repo(git_repo, commit):
+    """A git repository on main with two committed files"""
+    commit(git_repo, "app.py", "a\n")
+    commit(git_repo, "old name.py", "b\n")
+    return git_repo
+
+def test_porcelain_changes(repo, git):
+    """Staged, modified, renamed and untracked paths are read from one status call"""
+    (repo / "app.py").write_text("a\nb\n")
+    git(repo, "add", "app.py")
+    (repo / "app.py").write_text("a\nb\nc\n")
+    git(repo, "mv", "old name.py", "new name.py")
+    (repo / "notes dir").mkdir()
+    (repo / "notes dir" / "todo.txt").write_text("x\n")
+
+    changes = GitAnalyzer(str(repo)).get_uncommitted_changes()
+    assert sorted(changes["staged"]) == ["app.py", "new name.py"]
+    assert changes["modified"] == ["app.py"]
+    assert changes["untracked"] == ["notes dir/todo.txt"]
+
+def test_porcelain_conflict(repo, git, commit):
+    """Unmerged paths count as both staged and modified"""
+    git(repo, "checkout", "-q", "-b", "topic")
+    commit(repo, "app.py", "topic\n")
+    git(repo, "checkout", "-q", "main")
+    commit(repo, "app.py", "main\n")
+    subprocess.run(["git", "merge", "-q", "topic"], cwd=repo, capture_output=True)
+
+    changes = GitAnalyzer(str(repo)).get_uncommitted_changes()
+    assert changes["staged"] == ["app.py"]
+    assert changes["modified"] == ["app.py"]
+
+def test_porcelain_ahead_behind(repo, git, commit, tmp_path):
+    """Ahead and behind counts come from the upstream of a clone"""
+    clone = tmp_path / "clone"
+    git(tmp_path, "clone", "-q", str(repo), str(clone))
+    commit(repo, "app.py", "upstream\n")
+    git(clone, "fetch", "-q")
+    commit(clone, "local.py", "one\n")
+    commit(clone, "local2.py", "two\n")
+
+    analyzer = GitAnalyzer(str(clone))
+    assert analyzer.get_current_branch() == "main"
+    assert analyzer.get_remote_sync_status() == {
+        "upstream": "origin/main",
+        "ahead": 2,
+        "behind": 1
+    }
+
+def test_porcelain_without_upstream(repo):
+    """A branch without an upstream reports no_upstream"""
+    assert GitAnalyzer(str(repo)).get_remote_sync_status() == {"status": "no_upstream"}
+
+def test_porcelain_detached_head(repo, git):
+    """A detached HEAD is reported as HEAD"""
+    git(repo, "checkout", "-q", "--detach")
+    analyzer = GitAnalyzer(str(repo))
+    assert analyzer.get_current_branch() == "HEAD"
+    assert analyzer.get_remote_sync_status() == {"status": "no_upstream"}
+
+def test_porcelain_unborn_branch(git_repo):
+    """A repository without commits still reports its branch"""
+    (git_repo / "first.py").write_text("x\n")
+    analyzer = GitAnalyzer(str(git_repo))
+    assert analyzer.get_current_branch() == "main"
+    assert analyzer.get_uncommitted_changes()["untracked"] == ["first.py"]
+
+def test_porcelain_outside_git(tmp_path):
+    """Outside a repository there is no branch and no changes"""
+    analyzer = GitAnalyzer(str(tmp_path))
+    assert analyzer.get_current_branch() is None
+    assert analyzer.get_uncommitted_changes() == {"staged": [], "modified": [], "untracked": []}
+    assert analyzer.get_remote_sync_status() == {"error": "Not in a git repository"}
@@ -16,3 +16,54 @@ def test_load_session_objectives():
     objectives = scanner.load_session_objectives()
     # Should return list even if file doesn't exist
     assert isinstance(objectives, list)
+
+def _write_sources(root):
+    """Write a UTF-8 source and a Latin-1 source, both with markers"""
+    (root / "app.py").write_text("# TODO: handle café names\nx = 1\n", encoding="utf-8")
+    (root / "legacy.py").write_bytes("# FIXME: caf\xe9 encoding\n".encode("latin-1"))
+
+@pytest.fixture
+def git_project(git_repo):
+    """A git work tree with an untracked UTF-8 and Latin-1 source"""
+    _write_sources(git_repo)
+    return git_repo
+
+def test_git_grep_markers_skip_non_utf8(git_project):
+    """Files whose marker lines are not UTF-8 are skipped, as before git grep"""
+    markers = WorkItemsScanner(str(git_project)).scan_code_markers()
+    assert markers["todos"] == [
+        {"file": "app.py", "line": 1, "text": "# TODO: handle café names"}
+    ]
+    assert markers["fixmes"] == []
+
+def test_walk_markers_skip_non_utf8(tmp_path):
+    """The walk fallback outside git applies the same UTF-8 rule"""
+    _write_sources(tmp_path)
+    markers = WorkItemsScanner(str(tmp_path)).scan_code_markers()
+    assert markers["todos"] == [
+        {"file": "app.py", "line": 1, "text": "# TODO: handle café names"}
+    ]
+    assert markers["fixmes"] == []
+
+def _write_tree(root):
+    """Write sources whose paths do and do not look like tests"""
+    for rel_path in ("latest/x.py", "contest/foo.py", "attestation.py",
+                     "tests/helpers.py", "src/test_auth.py", "pkg/auth_test.go",
+                     "web/app.spec.ts", "web/app.test.js", "node_modules/lib/index.js"):
+        path = root / rel_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("// TODO: revisit\n")
+
+def _todo_files(root):
+    markers = WorkItemsScanner(str(root)).scan_code_markers()
+    return sorted(todo["file"] for todo in markers["todos"])
+
+def test_git_grep_skips_only_test_paths(git_repo):
+    """Only test directories and test file names are skipped, not any path containing 'test'"""
+    _write_tree(git_repo)
+    assert _todo_files(git_repo) == ["attestation.py", "contest/foo.py", "latest/x.py"]
+
+def test_walk_skips_only_test_paths(tmp_path):
+    """The walk fallback skips the same paths"""
+    _write_tree(tmp_path)
+    assert _todo_files(tmp_path) == ["attestation.py", "contest/foo.py", "latest/x.py"]
@@ -5,55 +5,137 @@ Work Items Scanner
 Scans code for TODOs, FIXMEs, and loads session objectives.
 """
 
+import os
 import re
 import json
+import subprocess
+from fnmatch import fnmatch
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, Iterator, List, Optional, Tuple
 
 
 class WorkItemsScanner:
     """Scan project for work items"""
 
+    TODO_RE = re.compile(r'TODO[:\-]', re.IGNORECASE)
+    FIXME_RE = re.compile(r'FIXME[:\-]', re.IGNORECASE)
+    MARKER_RE = re.compile(rb'(?:TODO|FIXME)[:\-]', re.IGNORECASE)
+    SKIP_DIRS = frozenset({
+        ".git", "node_modules", "venv", ".venv", "__pycache__", "dist",
+        "build", "target", ".mypy_cache", ".pytest_cache"
+    })
+    TEST_DIRS = frozenset({"test", "tests", "__tests__"})
+    TEST_FILE_PATTERNS = ("test_*", "*_test.*", "*.test.*", "*.spec.*")
+
     def __init__(self, project_path: str = "."):
         """Initialize scanner with project path"""
         self.project_path = Path(project_path)
 
+    @classmethod
+    def _skip_path(cls, path: str) -> bool:
+        """Skip test files and anything under test or node_modules directories"""
+        *dirs, name = path.split("/")
+        if any(d in cls.TEST_DIRS or d == "node_modules" for d in dirs):
+            return True
+        return any(fnmatch(name, pattern) for pattern in cls.TEST_FILE_PATTERNS)
+
+    def _git_grep_markers(self, patterns: List[str]) -> Optional[List[Tuple[str, int, bytes]]]:
+        """Find marker lines with git grep, or None outside a git work tree"""
+        try:
+            result = subprocess.run(
+                ["git", "grep", "--untracked", "-z", "-n", "-i", "-I", "-m", "40",
+                 "-E", "(TODO|FIXME)[:-]", "--", *patterns],
+                cwd=self.project_path,
+                capture_output=True
+            )
+        except FileNotFoundError:
+            return None
+
+        # Exit status 1 means no matches; anything else is an error
+        if result.returncode not in (0, 1):
+            return None
+
+        matches = []
+        for line in result.stdout.split(b"\n"):
+            if not line:
+                continue
+            file_path, line_num, text = line.split(b"\0", 2)
+            file_path = os.fsdecode(file_path)
+            if not self._skip_path(file_path):
+                matches.append((file_path, int(line_num), text))
+        return matches
+
+    def _walk(self, root: str, prefix: str, patterns: List[str]) -> Iterator[Tuple[str, str]]:
+        """Yield (path, relative path) for matching files, pruning SKIP_DIRS"""
+        try:
+            entries = sorted(os.scandir(root), key=lambda e: e.name)
+        except OSError:
+            return
+
+        for entry in entries:
+            rel_path = prefix + entry.name
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name not in self.SKIP_DIRS:
+                    yield from self._walk(entry.path, rel_path + "/", patterns)
+            elif any(fnmatch(entry.name, pattern) for pattern in patterns):
+                yield entry.path, rel_path
+
+    def _walk_markers(self, patterns: List[str]) -> List[Tuple[str, int, bytes]]:
+        """Find marker lines by reading every matching file"""
+        matches = []
+        for file_path, rel_path in self._walk(str(self.project_path), "", patterns):
+            if self._skip_path(rel_path):
+                continue
+
+            # Read bytes; only matching lines are decoded later
+            try:
+                with open(file_path, 'rb') as f:
+                    for line_num, line in enumerate(f, 1):
+                        # Cheap substring test rejects most lines before the regex
+                        upper = line.upper()
+                        if b"TODO" not in upper and b"FIXME" not in upper:
+                            continue
+                        if self.MARKER_RE.search(line):
+                            matches.append((rel_path, line_num, line))
+            except IOError:
+                # Skip files we can't read
+                continue
+        return matches
+
+    @staticmethod
+    def _decode_markers(matches: List[Tuple[str, int, bytes]]) -> List[Tuple[str, int, str]]:
+        """Decode marker lines, dropping files whose markers are not UTF-8"""
+        decoded = []
+        undecodable = set()
+        for file_path, line_num, line in matches:
+            try:
+                decoded.append((file_path, line_num, line.decode('utf-8')))
+            except UnicodeDecodeError:
+                undecodable.add(file_path)
+        return [match for match in decoded if match[0] not in undecodable]
+
     def scan_code_markers(self, patterns: List[str] = None) -> Dict[str, List[Dict]]:
         """Scan code files for TODO/FIXME markers"""
         if patterns is None:
             patterns = ["*.py", "*.js", "*.ts", "*.tsx", "*.java", "*.go", "*.rs"]
 
+        # git grep honours .gitignore and skips binaries; walk the tree
+        # only when the project is not a git work tree
+        matches = self._git_grep_markers(patterns)
+        if matches is None:
+            matches = self._walk_markers(patterns)
+        matches = self._decode_markers(matches)
+
         todos = []
         fixmes = []
-
-        for pattern in patterns:
-            for file_path in self.project_path.rglob(pattern):
-                # Skip test files and node_modules
-                if "test" in str(file_path) or "node_modules" in str(file_path):
-                    continue
-
-                try:
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        for line_num, line in enumerate(f, 1):
-                            # Match TODO: or TODO -
-                            if re.search(r'TODO[:\-]', line, re.IGNORECASE):
-                                comment = line.strip()
-                                todos.append({
-                                    "file": str(file_path.relative_to(self.project_path)),
-                                    "line": line_num,
-                                    "text": comment
-                                })
-                            # Match FIXME: or FIXME -
-                            if re.search(r'FIXME[:\-]', line, re.IGNORECASE):
-                                comment = line.strip()
-                                fixmes.append({
-                                    "file": str(file_path.relative_to(self.project_path)),
-                                    "line": line_num,
-                                    "text": comment
-                                })
-                except (IOError, UnicodeDecodeError):
-                    # Skip files we can't read
-                    continue
+        for file_path, line_num, line in matches:
+            item = {"file": file_path, "line": line_num, "text": line.strip()}
+            # Match TODO: or TODO -
+            if self.TODO_RE.search(line):
+                todos.append(item)
+            # Match FIXME: or FIXME -
+            if self.FIXME_RE.search(line):
+                fixmes.append(dict(item))
 
         return {
             "todos": todos[:20],  # Limit to first 20
@@ -5,11 +5,13 @@ Checkpoint Manager
 Handles automatic checkpoint generation with git diff analysis.
 """
 
+import os
 import subprocess
 import json
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional
 
 
 class CheckpointManager:
@@ -35,37 +37,45 @@ class CheckpointManager:
         except subprocess.CalledProcessError:
             return None
 
+    def _iter_git_lines(self, args: List[str]) -> Iterator[str]:
+        """Run git command on first iteration and yield its output lines"""
+        with subprocess.Popen(
+            ["git"] + args,
+            cwd=self.project_path,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            bufsize=1
+        ) as proc:
+            for line in proc.stdout:
+                yield line.rstrip("\n")
+
     def analyze_git_changes(self) -> Dict[str, List[str]]:
         """Analyze git diff for file changes"""
-        # Get modified files with stats
-        diff_output = self._run_git(["diff", "--stat"])
-
         modified = []
         added = []
         deleted = []
 
-        if diff_output:
-            for line in diff_output.split("\n"):
-                if "|" in line:
-                    filename = line.split("|")[0].strip()
-                    modified.append(filename)
+        # Get modified files with stats
+        for line in self._iter_git_lines(["diff", "--stat"]):
+            if "|" in line:
+                filename = line.split("|")[0].strip()
+                modified.append(filename)
 
         # Get staged files
-        staged_output = self._run_git(["diff", "--cached", "--name-status"])
-        if staged_output:
-            for line in staged_output.split("\n"):
-                if not line:
-                    continue
-                parts = line.split("\t")
-                if len(parts) == 2:
-                    status, filename = parts
-                    if status == "A":
-                        added.append(filename)
-                    elif status == "D":
-                        deleted.append(filename)
-                    elif status == "M":
-                        if filename not in modified:
-                            modified.append(filename)
+        for line in self._iter_git_lines(["diff", "--cached", "--name-status"]):
+            if not line:
+                continue
+            parts = line.split("\t")
+            if len(parts) == 2:
+                status, filename = parts
+                if status == "A":
+                    added.append(filename)
+                elif status == "D":
+                    deleted.append(filename)
+                elif status == "M":
+                    if filename not in modified:
+                        modified.append(filename)
 
         return {
             "modified": modified,
@@ -104,9 +114,6 @@ class CheckpointManager:
         """Load TDD metrics from .ccmp/state.json"""
         state_file = self.project_path / ".ccmp" / "state.json"
 
-        if not state_file.exists():
-            return None
-
         try:
             with open(state_file) as f:
                 state = json.load(f)
@@ -128,12 +135,17 @@ class CheckpointManager:
         timestamp = datetime.now()
         checkpoint_id = timestamp.strftime("%Y-%m-%dT%H-%M-%S")
 
-        changes = self.analyze_git_changes()
-        commits = self.get_recent_commits()
-        tdd_metrics = self.load_tdd_metrics()
+        # The git queries are independent, so run them concurrently
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            changes_future = executor.submit(self.analyze_git_changes)
+            commits_future = executor.submit(self.get_recent_commits)
+            # Get current commit hash for tracking
+            commit_future = executor.submit(self._run_git, ["rev-parse", "HEAD"])
+            tdd_metrics = self.load_tdd_metrics()
 
-        # Get current commit hash for tracking
-        current_commit = self._run_git(["rev-parse", "HEAD"])
+        changes = changes_future.result()
+        commits = commits_future.result()
+        current_commit = commit_future.result()
 
         lines = []
         lines.append(f"# Checkpoint: {checkpoint_id}")
@@ -200,8 +212,16 @@ class CheckpointManager:
 
     def get_latest_checkpoint(self) -> Optional[Path]:
         """Get most recent checkpoint file"""
-        checkpoints = sorted(self.checkpoints_dir.glob("*.md"), reverse=True)
-        return checkpoints[0] if checkpoints else None
+        # Checkpoint names are timestamps, so the greatest name is the latest
+        latest = None
+        try:
+            with os.scandir(self.checkpoints_dir) as entries:
+                for entry in entries:
+                    if entry.name.endswith(".md") and (latest is None or entry.name > latest.name):
+                        latest = entry
+        except FileNotFoundError:
+            return None
+        return Path(latest.path) if latest else None
 
 
 def main():